@@ -705,6 +705,21 @@ class SignalAcquisitionEngine(pt.PrintClient):
         except queue.Empty:
             return []
     
+    def get_data_batch(self, timeout: float = 0.5) -> List[SampleData]:
+        """阻塞等待第一批数据，然后非阻塞地取空队列，返回合并后的样本"""
+        try:
+            samples = list(self.data_queue.get(timeout=timeout))
+        except queue.Empty:
+            return []
+        
+        # 数据到达后立即唤醒，不再轮询或休眠
+        try:
+            while True:
+                samples.extend(self.data_queue.get_nowait())
+        except queue.Empty:
+            pass
+        return samples
+    
     def get_statistics(self) -> Dict[str, Any]:
         """获取采集统计信息"""
         stats = self.statistics.copy()
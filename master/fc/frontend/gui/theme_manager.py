@@ -28,6 +28,7 @@
 
 import tkinter as tk
 import tkinter.ttk as ttk
+from contextlib import contextmanager
 from fc.frontend.gui import guiutils as gus
 
 ## THEME DEFINITIONS ##########################################################
@@ -96,6 +97,8 @@ class ThemeManager:
             'dark': DARK_THEME
         }
         self.callbacks = []  # List of callbacks to call when theme changes
+        self._batch_depth = 0  # Nesting level of batched_updates
+        self._pending_refreshes = {}  # Refreshes deferred to the end of a batch
     
     def get_color(self, color_name):
         """Get a color value from the current theme."""
@@ -136,25 +139,55 @@ class ThemeManager:
         except Exception as e:
             print(f"[DEBUG] Error unregistering theme callback: {e}")
     
+    @contextmanager
+    def batched_updates(self):
+        """
+        Defer refreshes requested through request_refresh until the
+        outermost batch exits, then run each one once. Reentrant.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._pending_refreshes = self._pending_refreshes, {}
+                for refresh in pending.values():
+                    try:
+                        refresh()
+                    except (tk.TclError, AttributeError, RuntimeError) as e:
+                        print(f"Theme refresh error (application may be closing): {e}")
+    
+    def request_refresh(self, key, refresh):
+        """
+        Run refresh now, or once at the end of the current batch if called
+        within batched_updates. Requests with the same key are merged.
+        """
+        if self._batch_depth:
+            self._pending_refreshes[key] = refresh
+        else:
+            refresh()
+    
     def _notify_callbacks(self):
         """Notify all registered callbacks of theme change."""
         # Create a copy of callbacks to avoid modification during iteration
         callbacks_copy = self.callbacks.copy()
-        for callback in callbacks_copy:
-            try:
-                # Check if callback is still valid before calling
-                if callable(callback):
-                    callback()
-            except (tk.TclError, AttributeError, RuntimeError) as e:
-                print(f"Theme callback error (application may be closing): {e}")
-                # Remove invalid callback to prevent future errors
-                if callback in self.callbacks:
-                    self.callbacks.remove(callback)
-            except Exception as e:
-                print(f"Theme callback error: {e}")
-                # Remove problematic callback
-                if callback in self.callbacks:
-                    self.callbacks.remove(callback)
+        with self.batched_updates():
+            for callback in callbacks_copy:
+                try:
+                    # Check if callback is still valid before calling
+                    if callable(callback):
+                        callback()
+                except (tk.TclError, AttributeError, RuntimeError) as e:
+                    print(f"Theme callback error (application may be closing): {e}")
+                    # Remove invalid callback to prevent future errors
+                    if callback in self.callbacks:
+                        self.callbacks.remove(callback)
+                except Exception as e:
+                    print(f"Theme callback error: {e}")
+                    # Remove problematic callback
+                    if callback in self.callbacks:
+                        self.callbacks.remove(callback)
     
     def apply_ttk_theme(self, style):
         """Apply current theme to ttk.Style object."""
@@ -813,10 +813,9 @@ class Base(ttk.Frame, ResponsiveMixin):
             except (tk.TclError, AttributeError):
                 pass
             
-            # Force refresh of all widgets
+            # Force refresh of all widgets, once all theme callbacks have run
             try:
-                self.master.update_idletasks()
-                print(f"[DEBUG] Interface refresh completed")
+                theme_manager.request_refresh(self.master, self.master.update_idletasks)
             except (tk.TclError, AttributeError):
                 pass
             
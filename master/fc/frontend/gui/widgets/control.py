@@ -33,9 +33,15 @@
 
 ## IMPORTS #####################################################################
 import os
+import re
+import queue as qu
+import csv
 import time as tm
 import random as rd
 import multiprocessing as mp
+import multiprocessing.shared_memory as shm
+import multiprocessing.resource_tracker as rt
+import concurrent.futures as cf
 import copy as cp
 
 import math
@@ -48,6 +54,14 @@ import tkinter.filedialog as fdg
 import tkinter.ttk as ttk
 import tkinter.font as fnt
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from fc import archive as ac, printer as pt, standards as std, utils as us
 from fc.backend import mapper as mr
 
@@ -68,6 +82,38 @@ P_INDEX, P_FAN = 's', 'f'
 P_INDICES, P_FANS = 'S', 'F'
 P_STEP = 'k'
 
+# Non-negative decimal input accepted by entry validation (partial input such
+# as "3." is allowed while typing)
+_NUMERIC_RE = re.compile(r'^\d*\.?\d*$')
+
+def _classifyRows(block, rip, pad):
+    """
+    Return two boolean arrays that flag the rows of the 2D array BLOCK that
+    contain the values RIP and PAD, respectively.
+    """
+    return (block == rip).any(axis = 1), (block == pad).any(axis = 1)
+
+if NUMBA_AVAILABLE:
+    @njit(cache = True)
+    def _classifyRowsJIT(block, rip, pad):
+        N, M = block.shape
+        rips = np.zeros(N, np.bool_)
+        pads = np.zeros(N, np.bool_)
+        for i in range(N):
+            for j in range(M):
+                x = block[i, j]
+                if x == rip:
+                    rips[i] = True
+                elif x == pad:
+                    pads[i] = True
+        return rips, pads
+
+    def _classifyRows(block, rip, pad, _numpy = _classifyRows):
+        # Object arrays (e.g. mixed None entries) cannot be compiled
+        if block.dtype.kind in "iuf":
+            return _classifyRowsJIT(block, rip, pad)
+        return _numpy(block, rip, pad)
+
 ## MAIN WIDGET #################################################################
 class ControlWidget(ttk.Frame, pt.PrintClient):
     """
@@ -919,7 +965,6 @@ class MainControlWidget(ttk.Frame, pt.PrintClient):
             self.display.set(self.values[min(k, self.n - 1)])
         elif self.flowType == self.FT_TV:
             dc = self._getInterpolatedDC(t)
-            print(t, dc)
             self._sendDirect(dc, False)
         else:
             self.printe("Flow type unavailable")
@@ -2277,8 +2322,10 @@ class ControlPanelWidget(ttk.Frame, pt.PrintClient):
                 filename =  ("{}"*len(name) + "_{}.").format(*name, index) + ext
 
         self._setActiveWidgets(tk.DISABLED)
+        # NOTE: the mappings are sent to the logger process and must be
+        # picklable, so they are materialized once here
         self.dataLogger.start(filename,script = self._getScript(),
-            mappings = [str(mapping) for mapping in self.display.getMappings()])
+            mappings = tuple(map(str, self.display.getMappings())))
 
     def _getScript(self):
         """
@@ -2324,8 +2371,10 @@ class ControlPanelWidget(ttk.Frame, pt.PrintClient):
         """
         Setup input validations for control panel widgets.
         """
-        # Register validation function
-        vcmd = (self.register(self._validateInput), '%P')
+        # Register validation function once and reuse the Tcl command name
+        if not hasattr(self, '_vcmd'):
+            self._vcmd = (self.register(self._validateInput), '%P')
+        vcmd = self._vcmd
         
         # Apply validation to relevant entry widgets
         for widget_name in ['timeEntry', 'stepEntry', 'valueEntry']:
@@ -2344,15 +2393,8 @@ class ControlPanelWidget(ttk.Frame, pt.PrintClient):
         Returns:
             bool: True if valid, False otherwise
         """
-        if value == "":
-            return True
-        
-        try:
-            # Allow positive numbers (int or float)
-            float_val = float(value)
-            return float_val >= 0
-        except ValueError:
-            return False
+        # Allow positive numbers (int or float) without exception-driven parsing
+        return value == "" or _NUMERIC_RE.match(value) is not None
 
     def _setActiveWidgets(self, state):
         """
@@ -2512,12 +2554,13 @@ class DisplayMaster(ttk.Frame, pt.PrintClient):
         self.displays[self.current].redraw()
 
     def getMappings(self):
-        mappings = []
-        for display in self.displays.values():
-            mapping = display.getMapping()
-            if mapping is not None:
-                mappings.append(mapping)
-        return mappings
+        """
+        Return a generator over the (cached) mappings of the displays that
+        have one.
+        """
+        return (mapping for mapping in
+            (display.getMapping() for display in self.displays.values())
+            if mapping is not None)
 
     # Internal methods ---------------------------------------------------------
     def _update(self, *event):
@@ -2569,7 +2612,6 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
         self.maxRPM = self.archive[ac.maxRPM]
         self.maxFans = self.archive[ac.maxFans]
 
-        print("**", self.R, self.C, self.L, self.RC, self.RCL)
         self.empty_color = empty_color
         self.off_color = off_color
         gd.BaseGrid.__init__(self, master, self.R, self.C, cursor = self.CURSOR,
@@ -2577,8 +2619,8 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
         pt.PrintClient.__init__(self, pqueue)
 
         # Mapping ..............................................................
-        self.values_g = [0]*self.size_g
-        self.selected_g = [False]*self.size_g
+        self.values_g = np.zeros(self.size_g, dtype = np.float64)
+        self.selected_g = np.zeros(self.size_g, dtype = bool)
 
         # FIXME transplant behavior that should be in Mapper
         self.getIndex_g = self.mapper.index_KG
@@ -2589,11 +2631,15 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
         self.nslaves = len(self.archive[ac.savedSlaves])
         self.size_k = self.nslaves*self.maxFans
         self.range_k = range(self.size_k)
-        self.F_buffer = [0]*(2*self.size_k)
+        self.F_buffer = np.zeros(2*self.size_k, dtype = np.float64)
 
-        self.control_buffer = []
+        self.control_buffer = None
         self._resetControlBuffer()
 
+        self._slave_gs = None
+        self._mapping_cache = None
+        self._cacheMapping()
+
         # Tools ................................................................
         self.toolBar = ttk.Frame(self, style = "Topbar.TFrame", padding = (12, 8))
         self.toolBar.grid(row = self.GRID_ROW + 1, sticky = "WE")
@@ -2669,6 +2715,7 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
         self.colors = colors
         self.numColors = len(colors)
         self.maxColor = self.numColors - 1
+        self._scale = self.maxColor/float(self.maxValue)
         self.high = high
         self.low = 0
         self.rows, self.columns = range(self.R), range(self.C)
@@ -2705,7 +2752,7 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
     def deactivate(self):
         # Optimized: Pre-allocate RIP array for better performance
         if not hasattr(self, '_rip_buffer') or len(self._rip_buffer) != self.size_g*2:
-            self._rip_buffer = [std.RIP] * (self.size_g*2)
+            self._rip_buffer = np.full(self.size_g*2, std.RIP, dtype = np.float64)
         self.feedbackIn(self._rip_buffer)
         pass
 
@@ -2721,7 +2768,10 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
             for g, value in updates:
                 if g >= 0:
                     self.update_g(g, value)
-            self.F_buffer = F
+            if len(F) == len(self.F_buffer):
+                self.F_buffer[:] = F
+            else:
+                self.F_buffer = np.asarray(F, dtype = np.float64)
         else:
             self.printw("F received while grid isn't built. Ignoring.")
 
@@ -2762,7 +2812,7 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
         # Optimized: Batch coordinate calculations and reduce function calls
         try:
             # Pre-fill control buffer with current DCs so unselected fans retain their values
-            if hasattr(self, 'F_buffer') and self.F_buffer and len(self.F_buffer) >= 2*self.size_k:
+            if len(self.F_buffer) >= 2*self.size_k:
                 self.control_buffer[:] = self.F_buffer[self.size_k:self.size_k*2]
             
             # Cache method references for better performance
@@ -2785,11 +2835,11 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
                         self.R, self.C, self.L, self.nslaves, self.maxFans,
                         self.maxRPM, t, t_step)
         except Exception as e:
-            print(k)
+            self.printd("Mapping failed at k = {}".format(k))
             raise e
 
         else:
-            self.send_method(self.control_buffer)
+            self.send_method(self.control_buffer.tolist())
             if not self.holdVar.get():
                 self.deselectAll()
 
@@ -2867,16 +2917,20 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
             return
             
         self.values_g[g] = value
-        fill = self.empty_color
+        if self.layer_g(g) == self.layer:
+            self.filli(self.gridi_g(g), self._fill(value))
 
+    def _fill(self, value):
+        """
+        Get the cell color that corresponds to the given value.
+        """
         if value >= 0:
-            fill = self.colors[min(self.maxColor,
-                int(((value*self.maxColor)/self.maxValue)))]
+            if value < self.maxValue:
+                return self.colors[int(value*self._scale)]
+            return self.colors[self.maxColor]
         elif value == std.RIP:
-            fill = self.off_color
-
-        if self.layer_g(g) == self.layer:
-            self.filli(self.gridi_g(g), fill)
+            return self.off_color
+        return self.empty_color
 
     # Selection ................................................................
     # Optimized: Use range() instead of while loop for better performance
@@ -2892,13 +2946,13 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
 
     def deselect_i(self, i):
         if self.deepVar.get():
-            l = 0
-            while l < self.L:
-                self.deselect_g(i + l*self.RC)
-                l += 1
+            # Batch deselect all layers for better performance
+            RC = self.RC
+            deselect_g = self.deselect_g  # Cache method reference
+            for l in range(self.L):
+                deselect_g(i + l * RC)
         else:
-            self.deselect_g(i + self.layer*self.RC)
-
+            self.deselect_g(i + self.layer * self.RC)
 
     def select_g(self, g):
         # Add bounds checking to prevent IndexError
@@ -2941,9 +2995,10 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
 
     def getMapping(self):
         """
-        Get the mapping data structure of this Grid.
+        Get the mapping data structure of this Grid. The returned list is
+        cached and shared; callers must not modify it.
         """
-        return [self.getIndex_g(k) for k in self.range_k]
+        return self._mapping_cache
 
     # Internal methods .........................................................
     def _onLayerChange(self, *A):
@@ -2966,6 +3021,8 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
         """
         self.offset = self.offsets[self.typeMenuVar.get()]
         self.maxValue = self.maxValues[self.typeMenuVar.get()]
+        if hasattr(self, 'maxColor'):
+            self._scale = self.maxColor/float(self.maxValue)
 
     def _onSelectModeChange(self, *E):
         """
@@ -2974,40 +3031,65 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
         pass
 
     def _scheduleAdjust(self, *E):
+        # Coalesce bursts of resize events into a single pending adjustment
+        # instead of unbinding and rebinding <Configure> each time
+        if self.adjusting:
+            return
         try:
             # Check if widget still exists before scheduling
             if not self.winfo_exists():
                 return
+            self.adjusting = True
             self.after(self.RESIZE_MS, self._adjust)
-            self.unbind("<Configure>")
         except tk.TclError:
             # Widget has been destroyed, ignore
-            pass
+            self.adjusting = False
 
     def _updateStyle(self, event = None):
         """
         Enforce style rules when switching layers.
         """
-        l = self.layer
+        # Single pass over the visible layer: one canvas call per cell sets
+        # both its fill and its selection outline
         offset = self.layer*self.RC
-        for g in range(offset, offset + self.RC):
-            # Add bounds checking to prevent IndexError
-            if g < len(self.values_g):
-                self.update_g(g, self.values_g[g])
-                if g < len(self.selected_g) and self.selected_g[g]:
-                    self.select_g(g)
+        values_g, selected_g = self.values_g, self.selected_g
+        configi, fill = self.configi, self._fill
+        for i in range(self.RC):
+            g = offset + i
+            if selected_g[g]:
+                configi(i, fill(values_g[g]),
+                    self.OUTLINE_SELECTED, self.WIDTH_SELECTED)
             else:
-                self.deselect_g(g)
+                configi(i, fill(values_g[g]),
+                    self.OUTLINE_NORMAL, self.WIDTH_NORMAL)
 
     def _resetControlBuffer(self):
         """
         Set the control buffer back to its default value.
         """
-        self.control_buffer = [0]*self.size_k
+        if self.control_buffer is None:
+            self.control_buffer = np.zeros(self.size_k, dtype = np.float64)
+        else:
+            self.control_buffer.fill(0)
+
+    def _cacheMapping(self):
+        """
+        Precompute the lookups derived from the mapper, namely the K to G
+        mapping returned by getMapping and the mapped grid indices of each
+        slave's fans. Must be called again whenever the mapping changes.
+        """
+        self._mapping_cache = [self.getIndex_g(k) for k in self.range_k]
+
+        maxFans = self.maxFans
+        self._slave_gs = []
+        for s in range(self.nslaves):
+            G = [self.getIndex_g(k) for k in range(s*maxFans, (s + 1)*maxFans)]
+            self._slave_gs.append(
+                np.asarray([g for g in G if g >= 0], dtype = np.int32))
 
     def _adjust(self, *E):
+        self.adjusting = False
         self.redraw()
-        self.bind("<Configure>", self._scheduleAdjust)
 
     @staticmethod
     def _onLeftClick(grid, i):
@@ -3072,13 +3154,12 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
             grid.drag_end != None:
 
             if grid.selectMode.get() == grid.SM_SELECT:
-                row_1, row_2 = grid.drag_start//grid.R, grid.drag_end//grid.R
-                row_start = min(row_1, row_2)
-                row_end = max(row_1, row_2)
-
-                col_1, col_2 = grid.drag_start%grid.R, grid.drag_end%grid.R
-                col_start = min(col_1, col_2)
-                col_end = max(col_1, col_2)
+                # Cells are stored row-major, so rows and columns both come
+                # from dividing by the number of columns
+                row_1, col_1 = divmod(grid.drag_start, grid.C)
+                row_2, col_2 = divmod(grid.drag_end, grid.C)
+                row_start, row_end = sorted((row_1, row_2))
+                col_start, col_end = sorted((col_1, col_2))
 
                 for r in range(row_start, row_end + 1):
                     for c in range(col_start, col_end + 1):
@@ -3092,22 +3173,22 @@ class GridWidget(gd.BaseGrid, pt.PrintClient):
     @staticmethod
     def _onDoubleLeft(grid, i):
         k_i = grid.getIndex_k(i + grid.layer*grid.RC)
-        k_0 = grid.slave_k(k_i)*grid.maxFans
+        if k_i < 0:
+            return
 
-        for k in range(k_0, k_0 + grid.maxFans):
-            g = grid.getIndex_g(k)
-            if g >= 0:
-                grid.select_g(g)
+        select_g = grid.select_g
+        for g in grid._slave_gs[grid.slave_k(k_i)].tolist():
+            select_g(g)
 
     @staticmethod
     def _onDoubleRight(grid, i):
         k_i = grid.getIndex_k(i + grid.layer*grid.RC)
-        k_0 = grid.slave_k(k_i)*grid.maxFans
+        if k_i < 0:
+            return
 
-        for k in range(k_0, k_0 + grid.maxFans):
-            g = grid.getIndex_g(k)
-            if g >= 0:
-                grid.deselect_g(g)
+        deselect_g = grid.deselect_g
+        for g in grid._slave_gs[grid.slave_k(k_i)].tolist():
+            deselect_g(g)
 
     @staticmethod
     def _const(dc):
@@ -3146,22 +3227,41 @@ class ColorBarWidget(ttk.Frame):
         self.canvas = tk.Canvas(self, bg = self.colors[-1],
             width = self.highLabel.winfo_width())
         self.canvas.grid(row = 1, sticky = 'NEWS')
+        self.canvas.bind("<ButtonPress-1>", self.redraw)
+
+        # The gradient is rendered into a single image that is reused across
+        # redraws instead of one canvas rectangle per color
+        self.image = None
+        self.imageIID = None
+        self.imageRows = None
+        self.imageWidth = 0
+
+        # Redraws are coalesced and skipped when the size has not changed
+        self._lastSize = (0, 0)
+        self._drawScheduled = False
 
         self.lowLabel = ttk.Label(self, text = "{} {}".format(self.low, unit),
             style = "Secondary.TLabel")
         self.lowLabel.grid(row = 2, sticky = "EW")
 
-        print("[REM] Pass MAX RPM to color bar") # FIXME
+        # Sizes are cached from <Configure> events so that drawing does not
+        # query Tk for geometry
+        self._cachedWidth = max(self.highLabel.winfo_reqwidth(), 1)
+        self._cachedHeight = max(self.winfo_reqheight(), 1)
+        self.bind("<Configure>", self._onConfigure)
+        self.highLabel.bind("<Configure>", self._onLabelConfigure)
 
-        self._draw()
+        self.redraw()
 
     # API ......................................................................
     def redraw(self, *E):
         """
-        Rebuild the color bar to adjust to a new size.
+        Rebuild the color bar to adjust to a new size. The redraw runs once
+        Tk is idle, so bursts of requests result in a single draw.
         """
-        self.canvas.delete(tk.ALL)
-        self._draw()
+        if not self._drawScheduled:
+            self._drawScheduled = True
+            self.after_idle(self._draw)
 
     def setHigh(self, new):
         """
@@ -3170,25 +3270,55 @@ class ColorBarWidget(ttk.Frame):
         self.high = new
 
     # Internal methods .........................................................
+    def _onConfigure(self, event):
+        """
+        Cache the new height of the widget and redraw to fit it.
+        """
+        self._cachedHeight = max(event.height, 1)
+        self.redraw()
+
+    def _onLabelConfigure(self, event):
+        """
+        Cache the width requested by the high label, which sets the width
+        of the bar.
+        """
+        self._cachedWidth = max(self.highLabel.winfo_reqwidth(), 1)
+
     def _draw(self, *E):
         """
         Draw the colorbar.
         """
-        self.winfo_toplevel().update_idletasks()
-        height = max(self.winfo_height(), self.winfo_reqheight())
-        width = self.highLabel.winfo_reqwidth()
+        self._drawScheduled = False
+        height, width = self._cachedHeight, self._cachedWidth
+        if (width, height) == self._lastSize:
+            return
+        self._lastSize = (width, height)
         step = height/self.steps
         left, right = 0, width
-        y = 0
-        self.bind("<Button-1>", self.redraw)
-        for i in range(self.steps):
-            iid = self.canvas.create_rectangle(
-                left, y, right, y + step, fill = self.colors[i],
-                width = 0)
-            self.canvas.tag_bind(iid, "<ButtonPress-1>", self.redraw)
-            y += step
-        self.canvas.create_line(left, y, right, y, width = 4)
-        self.canvas.create_line(left, y, right, y, width = 2, fill = 'white')
+
+        # One row of pixel data per color, rebuilt only if the width changes
+        if self.imageRows is None or self.imageWidth != width:
+            self.imageRows = ["{" + " ".join((color,)*width) + "}"
+                for color in self.colors]
+            self.imageWidth = width
+        rows, last = self.imageRows, self.steps - 1
+
+        if self.image is None:
+            self.image = tk.PhotoImage(width = width, height = height)
+        else:
+            self.image.blank()
+            self.image.config(width = width, height = height)
+        self.image.put(" ".join(
+            [rows[min(int(y/step), last)] for y in range(height)]))
+
+        if self.imageIID is None:
+            self.imageIID = self.canvas.create_image(0, 0, anchor = tk.NW,
+                image = self.image)
+
+        y = height
+        self.canvas.delete("border")
+        self.canvas.create_rectangle(left, y - 2, right, y + 2, width = 1,
+            fill = 'white', outline = 'black', tags = "border")
 
 class LiveTable(pt.PrintClient, ttk.Frame):
     """
@@ -3205,6 +3335,28 @@ class LiveTable(pt.PrintClient, ttk.Frame):
     INF = float('inf')
     NINF = -INF
 
+    # Tcl procedure used to apply all of a frame's table updates in one call.
+    # Takes the Treeview path, a flat list of iid, values, tags triplets for
+    # whole rows (an empty tags list leaves the row's tags untouched) and a
+    # flat list of iid, column, value triplets for single cells.
+    BATCH_PROC = "::fc_lt_batch"
+    BATCH_SCRIPT = "proc " + BATCH_PROC + " {tree updates cells} {\n" \
+        "    foreach {iid vals tags} $updates {\n" \
+        "        if {[llength $tags]} {\n" \
+        "            $tree item $iid -values $vals -tags $tags\n" \
+        "        } else {\n" \
+        "            $tree item $iid -values $vals\n" \
+        "        }\n" \
+        "    }\n" \
+        "    foreach {iid column value} $cells {\n" \
+        "        $tree set $iid $column $value\n" \
+        "    }\n" \
+        "}"
+
+    # Bold table font and the column widths measured with it, shared by all
+    # instances (see _getFont)
+    _fontCache = None
+
 
     def __init__(self, master, archive, mapper, send_method, network, pqueue):
         """
@@ -3238,7 +3390,7 @@ class LiveTable(pt.PrintClient, ttk.Frame):
 
         # Mapping ..............................................................
         self.values_g = [0]*self.size_g
-        self.selected_g = [False]*self.size_g
+        self.selected_g = np.zeros(self.size_g, dtype = bool)
 
 
         # FIXME transplant behavior that should be in Mapper
@@ -3250,12 +3402,17 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         self.nslaves = len(self.archive[ac.savedSlaves])
         self.size_k = self.nslaves*self.maxFans
         self.range_k = range(self.size_k)
-        self.F_buffer = [0]*(2*self.size_k)
+        self.F_buffer = np.zeros(2*self.size_k, dtype = np.float64)
 
         self.selected_count = 0
-        self.control_buffer = []
+        self.control_buffer = None
         self._resetControlBuffer()
 
+        # Per-fan lookups used by map, indexed by k
+        self._g_of_k = None
+        self._l_of_k, self._r_of_k, self._c_of_k = None, None, None
+        self._cacheMapping()
+
         # Build menu ...........................................................
         self.main = ttk.Frame(self)
         self.main.pack(fill = tk.BOTH, expand = True)
@@ -3303,7 +3460,7 @@ class LiveTable(pt.PrintClient, ttk.Frame):
 
         # Sentinel .............................................................
         self.sentinelWidgets = []
-        self._sentinelCheck = lambda x: False
+        self._sentinelCheck = lambda RPM: np.zeros(RPM.shape, dtype = bool)
 
         self.sentinelFrame = ttk.Frame(
             self.topBar,
@@ -3407,6 +3564,10 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         self.sentinelFrame.pack(side = tk.RIGHT, **gus.padc)
         self.sentinelFlag = False
 
+        # Widget paths toggled together by _setSentinelState:
+        self._sentinelPaths = [str(widget) for widget in
+            self.sentinelWidgets + [self.sentinelApplyButton]]
+
         # Build table ..........................................................
         self.tableFrame = ttk.Frame(self.main)
         self.tableFrame.grid(row = self.TABLE_ROW, column = self.TABLE_COLUMN,
@@ -3414,6 +3575,7 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         self.table = ttk.Treeview(self.tableFrame,
             height = 32)
         self.table.pack(fill = tk.BOTH, expand = True)
+        self.tk.eval(self.BATCH_SCRIPT)
         # Add columns:
         self.columns = ("Index", "Max", "Min")
         self.specialColumns = len(self.columns)
@@ -3432,9 +3594,7 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         self.table.column("#0", width = 20, stretch = True)
 
         self.boldFontSettings = (gus.typography["code"]["font"][0], gus.typography["code"]["font"][1], "bold")
-        self.font = tk.font.Font(font = self.boldFontSettings)
-        self.rpmwidth = self.font.measure("12345")
-        self.specwidth = self.font.measure("  Index  ")
+        self.font, self.rpmwidth, self.specwidth = LiveTable._getFont()
         # Build columns:
         for column in self.columns[:self.specialColumns]:
             self.table.column(column,
@@ -3450,6 +3610,13 @@ class LiveTable(pt.PrintClient, ttk.Frame):
             anchor = "center", stretch = True)
         self.table.heading(self.columns[-1], text = " ")
 
+        # Column ids of the displayed values, by position within a row:
+        self._columnIDs = self.columns[:-1]
+
+        # Header line of matrix prints:
+        self._printHeader = "Module," + "".join(["{} RPM,".format(column)
+            for column in self.columns[self.specialColumns:]]) + "\n"
+
         # Configure tags:
         self.table.tag_configure(
             "H", # Highlight
@@ -3501,10 +3668,27 @@ class LiveTable(pt.PrintClient, ttk.Frame):
 
         # FIXME verify consistency with new standard
         # Add rows and build slave list:
-        self.slaves = {}
+        self.slaves = []
         self.fans = range(self.maxFans)
         self.numSlaves = 0
 
+        # Per-row constants, extended along with the slave list so that
+        # feedbackIn does not rebuild them every frame:
+        self._tags_N, self._tags_D, self._tags_H = [], [], []
+        self._rowPrefix = []
+
+        # Last tags and values shown on each row (None when unknown), used to
+        # skip rows that did not change and to retag rows only on transitions
+        self._rowTags, self._rowValues = [], []
+
+        # Latest feedback vector waiting to be displayed:
+        self._pendingF = None
+        self._flushScheduled = False
+
+        # Last block of fan values displayed, used to find the rows that
+        # changed:
+        self._lastBlock = None
+
     def networkIn(self, N):
         if not N[std.NS_I_CONN]:
             self.deactivate()
@@ -3513,8 +3697,7 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         pass
 
     def selectAll(self):
-        for index, iid in self.slaves.items():
-            self.table.selection_add(iid)
+        self.table.selection_add(self.slaves)
 
     def deselectAll(self):
         self.table.selection_set(())
@@ -3543,29 +3726,38 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         """
         # FIXME why are there redundant implementations of this? See GridWidget
         # FIXME no Exception handling?
-        # FIXME performance
-        # Pre-fill control buffer with current DCs so unselected fans retain their values
-        if hasattr(self, 'F_buffer') and self.F_buffer and len(self.F_buffer) >= 2*self.size_k:
-            self.control_buffer[:] = self.F_buffer[self.size_k:self.size_k*2]
-        for k in self.range_k:
-            g = self.getIndex_g(k)
-            s, f  = self.slave_k(k), self.fan_k(k)
-            if g == std.PAD: # FIXME prev: if g != std.PAD:
-                l, r, c = 0, 0, 0
-            else:
-                l, r, c = self.getCoordinates_g(s, f)
-
-            if self.selected_count == 0 or (g >= 0 and self.selected_g[g]):
-                self.control_buffer[k] = func(r, c, l, s, f,
-                    self.F_buffer[self.size_k + k], self.F_buffer[k],
-                    self.R, self.C, self.L, self.nslaves, self.maxFans,
-                    self.maxRPM, t, t_step)
-
-        self.send_method(self.control_buffer)
+        size_k = self.size_k
+        F_buffer = self.F_buffer
+        self._prefillControlBuffer()
+
+        # Gather the arguments of all affected fans at once and only call
+        # func for those
+        K = np.flatnonzero(self._selectedMask_k())
+        S, Fs = np.divmod(K, self.maxFans)
+        R, C, L = self.R, self.C, self.L
+        nslaves, maxFans, maxRPM = self.nslaves, self.maxFans, self.maxRPM
+        control_buffer = self.control_buffer
+        for k, r, c, l, s, f, d, p in zip(K.tolist(),
+            self._r_of_k[K].tolist(), self._c_of_k[K].tolist(),
+            self._l_of_k[K].tolist(), S.tolist(), Fs.tolist(),
+            F_buffer[size_k + K].tolist(), F_buffer[K].tolist()):
+            control_buffer[k] = func(r, c, l, s, f, d, p, R, C, L, nslaves,
+                maxFans, maxRPM, t, t_step)
+
+        self.send_method(control_buffer.tolist())
 
 
     def set(self, dc):
-        self.map(self._const(dc), 0, 0)
+        """
+        Map the given duty cycle. Equivalent to mapping _const(dc), but the
+        value is written to all affected fans at once.
+        """
+        self._prefillControlBuffer()
+        if self.selected_count == 0:
+            self.control_buffer[:] = dc
+        else:
+            self.control_buffer[self._selectedMask_k()] = dc
+        self.send_method(self.control_buffer.tolist())
 
     def apply(self):
         # FIXME
@@ -3589,7 +3781,6 @@ class LiveTable(pt.PrintClient, ttk.Frame):
 
     def redraw(self):
         # FIXME
-        print("redraw")
         pass
 
     def getMapping(self):
@@ -3624,6 +3815,18 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         return k % self.maxFans
 
     # Selection ................................................................
+    def _selectedMask_k(self):
+        """
+        Return a boolean array over network indices k that is True for the fans
+        a control operation applies to, i.e all of them when nothing is
+        selected and the mapped, selected ones otherwise.
+        """
+        if self.selected_count == 0:
+            return np.ones(self.size_k, dtype = bool)
+        G = self._g_of_k
+        selected_g = np.asarray(self.selected_g, dtype = bool)
+        return (G >= 0) & selected_g[np.maximum(G, 0)]
+
     def select_i(self, i):
         """
         Select a specific slave by index.
@@ -3668,7 +3871,7 @@ class LiveTable(pt.PrintClient, ttk.Frame):
                 initialize slave lists and display values).
         """
         if A is None:
-            for index in self.slaves:
+            for index in range(len(self.slaves)):
                 self.activatei(index)
         else:
             self.feedbackIn(A)
@@ -3678,13 +3881,18 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         "Turn on" the row corresponding to the slave in index i.
         """
         self.table.item(self.slaves[i], values = (i + 1), tag = "N")
+        self._rowTags[i] = None
 
     def deactivate(self):
         """
         Seemingly "turn off" all rows to indicate inactivity; meant to be used,
         primarily, upon network shutdown.
         """
-        for index in self.slaves:
+        # Drop feedback still waiting for _flush, as it would repaint the
+        # rows as active, and forget the last block shown
+        self._pendingF = None
+        self._lastBlock = None
+        for index in range(len(self.slaves)):
             self.deactivatei(index)
         self._resetControlBuffer()
 
@@ -3694,12 +3902,40 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         """
         self.table.item(self.slaves[i],
             values = (i + 1,), tag = "D")
+        self._rowTags[i] = None
 
     def _resetControlBuffer(self):
         """
         Set the control buffer back to its default value.
         """
-        self.control_buffer = [0]*self.size_k
+        if self.control_buffer is None:
+            self.control_buffer = np.zeros(self.size_k, dtype = np.float64)
+        else:
+            self.control_buffer.fill(0)
+
+    def _prefillControlBuffer(self):
+        """
+        Pre-fill the control buffer with the current DCs so that fans left
+        out of a control operation retain their values.
+        """
+        size_k = self.size_k
+        if len(self.F_buffer) >= 2*size_k:
+            self.control_buffer[:] = self.F_buffer[size_k:size_k*2]
+
+    def _cacheMapping(self):
+        """
+        Precompute the grid index and grid coordinates of every fan k so that
+        map does not query the mapper per fan. Unmapped fans get coordinates
+        (0, 0, 0). Must be called again whenever the mapping changes.
+        """
+        G = np.fromiter((self.getIndex_g(k) for k in self.range_k),
+            dtype = np.int32, count = self.size_k)
+        mapped = G != std.PAD  # FIXME prev: if g != std.PAD:
+        LRC = np.zeros((self.size_k, 3), dtype = np.int32)
+        for k in np.flatnonzero(mapped).tolist():
+            LRC[k] = self.getCoordinates_g(self.slave_k(k), self.fan_k(k))
+        self._g_of_k = G
+        self._l_of_k, self._r_of_k, self._c_of_k = LRC.T.copy()
 
     def _applySentinel(self, event = False):
         """
@@ -3708,12 +3944,9 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         try:
             if self.sentinelEntry.get() != '':
                 self.sentinelFlag = True
-                self.sentinelApplyButton.config(state = tk.DISABLED)
-
                 self._sentinelCheck = self._assembleSentinel()
 
-                for widget in self.sentinelWidgets:
-                    widget.config(state = tk.DISABLED)
+                self._setSentinelState(tk.DISABLED)
                 self.sentinelClearButton.config(state = tk.NORMAL)
         except Exception as e:
             self.printx(e, "Exception in live table:")
@@ -3755,10 +3988,13 @@ class LiveTable(pt.PrintClient, ttk.Frame):
     def _assembleSentinel(self):
         """
         Gather the user's configuration from the relevant input widgets and
-        build a new sentinel.
+        build a new sentinel. The sentinel takes an array of RPM values and
+        returns a boolean array of the same shape that flags the values that
+        trigger it.
         """
         check = self.sentinelMenuVar.get()
         value = int(self.sentinelEntry.get())
+        high, low = value*1.1, value*.9
 
         if check == "Above":
             return lambda rpm : rpm > value
@@ -3767,10 +4003,10 @@ class LiveTable(pt.PrintClient, ttk.Frame):
             return lambda rpm : rpm < value
 
         elif check == "Outside 10% of":
-            return lambda rpm : rpm > value*1.1 or rpm < value*.9
+            return lambda rpm : (rpm > high) | (rpm < low)
 
         elif check == "Within 10% of":
-            return lambda rpm : rpm < value*1.1 and rpm > value*.9
+            return lambda rpm : (rpm < high) & (rpm > low)
 
         elif check == "Not":
             return lambda rpm : rpm != value
@@ -3781,9 +4017,15 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         """
         self.sentinelFlag = False
         self.sentinelClearButton.config(state = tk.DISABLED)
-        for widget in self.sentinelWidgets:
-            widget.config(state = tk.NORMAL)
-        self.sentinelApplyButton.config(state = tk.NORMAL)
+        self._setSentinelState(tk.NORMAL)
+
+    def _setSentinelState(self, state):
+        """
+        Set the state of the sentinel configuration widgets and of the Apply
+        button with a single Tcl call.
+        """
+        self.tk.eval("\n".join("{} configure -state {}".format(path, state)
+            for path in self._sentinelPaths))
 
     def _printMatrix(self, event = None, sentinelValues = None):
         # FIXME should this be here?
@@ -3800,9 +4042,7 @@ class LiveTable(pt.PrintClient, ttk.Frame):
         self.printMatrixButton.config(state = tk.DISABLED)
 
         if not self.sentinelFlag:
-            for widget in self.sentinelWidgets:
-                widget.config(state = tk.DISABLED)
-            self.sentinelApplyButton.config(state = tk.DISABLED)
+            self._setSentinelState(tk.DISABLED)
 
         else:
             self.sentinelClearButton.config(state = tk.DISABLED)
@@ -3836,9 +4076,7 @@ class LiveTable(pt.PrintClient, ttk.Frame):
                 self.playPauseButton.config(state = tk.NORMAL)
                 self.printMatrixButton.config(state = tk.NORMAL)
                 if not self.sentinelFlag:
-                    for widget in self.sentinelWidgets:
-                        widget.config(state = tk.NORMAL)
-                    self.sentinelApplyButton.config(state = tk.NORMAL)
+                    self._setSentinelState(tk.NORMAL)
                     if not self.wasPaused:
                         self._playPause()
                 else:
@@ -3890,21 +4128,12 @@ class LiveTable(pt.PrintClient, ttk.Frame):
                 # Headers (fifth line):
 
                 # Write headers:
-                f.write("Module,")
-
-                for column in self.columns[self.specialColumns:]:
-                    f.write("{} RPM,".format(column))
-
-                # Move to next line:
-                f.write('\n')
-
-                # Write matrix:
-                for index, row in enumerate(self.latestMatrix):
-                    f.write("{},".format(index+1))
-                    for value in row[1:]:
-                        f.write("{},".format(value))
+                f.write(self._printHeader)
 
-                    f.write('\n')
+                # Write matrix (one row per module, with trailing separator):
+                csv.writer(f, lineterminator = '\n').writerows(
+                    (index + 1,) + tuple(row[1:]) + ('',)
+                    for index, row in enumerate(self.latestMatrix))
 
             self.donePrinting = True
             self._printM("Done printing",'G')
@@ -3940,23 +4169,53 @@ class LiveTable(pt.PrintClient, ttk.Frame):
 
     # Standard interface .......................................................
     def feedbackIn(self, F):
+        """
+        Process the feedback vector F. The buffered feedback used by map is
+        updated right away, while the table itself is refreshed once Tk is
+        idle, so that vectors arriving faster than the table can be redrawn
+        only cause the newest one to be displayed.
+        """
         if self.playPauseFlag:
+            if len(F) == len(self.F_buffer):
+                self.F_buffer[:] = F
+            else:
+                self.F_buffer = np.asarray(F, dtype = np.float64)
+
+            self._pendingF = F
+            if not self._flushScheduled:
+                self._flushScheduled = True
+                self.after_idle(self._flush)
+
+        self.built = True
+
+    def _flush(self):
+        """
+        Display the latest feedback vector received by feedbackIn.
+        """
+        F, self._pendingF = self._pendingF, None
+        self._flushScheduled = False
+        if F is not None and self.table.winfo_exists():
             # Performance optimized: cache frequently accessed values and use batch operations
             L = len(F)//2
             N = L//self.maxFans
             
             # Cache method references for performance
             table_insert = self.table.insert
-            table_item = self.table.item
             
             # Batch create new slave entries if needed
             if N > self.numSlaves:
                 new_slaves = []
                 for index in range(self.numSlaves, N):
                     stripe_tag = "stripe_even" if index % 2 == 0 else "stripe_odd"
-                    tags = ('N', stripe_tag)
+                    self._tags_N.append(("N", stripe_tag))
+                    self._tags_D.append(("D", stripe_tag))
+                    self._tags_H.append(("H", stripe_tag))
+                    self._rowPrefix.append((index + 1,))
+                    self._rowTags.append(None)
+                    self._rowValues.append(None)
                     slave_id = table_insert('', 'end',
-                        values = (index + 1,) + self.zeroes, tags = tags)
+                        values = self._rowPrefix[index] + self.zeroes,
+                        tags = self._tags_N[index])
                     new_slaves.append(slave_id)
                 
                 # Batch update slaves list
@@ -3968,38 +4227,99 @@ class LiveTable(pt.PrintClient, ttk.Frame):
             maxFans = self.maxFans
             sentinelFlag = self.sentinelFlag
             slaves = self.slaves
+            tags_N, tags_D, tags_H = self._tags_N, self._tags_D, self._tags_H
+            rowPrefix = self._rowPrefix
+            rowTags, rowValues = self._rowTags, self._rowValues
             
-            slave_i, vector_i = 0, L * offset
-            end_i = L + vector_i
-            tag = "N"
-            
-            # Process data in chunks for better performance
-            while vector_i < end_i:
-                values = tuple(F[vector_i:vector_i + maxFans])
-
-                if std.RIP in values:
-                    # This slave is disconnected
-                    stripe_tag = "stripe_even" if slave_i % 2 == 0 else "stripe_odd"
-                    tags = ("D", stripe_tag)
-                    table_item(slaves[slave_i], values = (slave_i + 1,), tags = tags)
-                elif std.PAD not in values:
-                    # This slave is active
-                    if sentinelFlag:
-                        for fan, value in enumerate(values):
-                            if self._sentinelCheck(values):
-                                tag = "H"
-                                self._executeSentinel(slave_i, fan, value)
-                    stripe_tag = "stripe_even" if slave_i % 2 == 0 else "stripe_odd"
-                    tags = (tag, stripe_tag)
-                    table_item(slaves[slave_i],
-                        values = (slave_i + 1, max(values), min(values)) + values, 
-                        tags = tags)
-                slave_i += 1
-                vector_i += maxFans
-
-            self.F_buffer = F
-
-        self.built = True
+            # Classify all slaves at once on an (N, maxFans) view of the
+            # displayed half of F: rows with RIP are disconnected, rows with
+            # PAD are skipped and the rest are active. Only the displayed half
+            # is converted, so that integral RPMs are not shown as floats
+            vector_i = L * offset
+            block = np.asarray(F[vector_i:vector_i + N*maxFans]).reshape(
+                N, maxFans)
+            rip, pad = _classifyRows(block, std.RIP, std.PAD)
+            active = np.flatnonzero(~rip & ~pad)
+
+            # Rows whose fan values match the last block shown need not be
+            # converted back into Python values unless their tags change
+            last = self._lastBlock
+            if last is not None and last.shape == block.shape:
+                dirty = (block != last).any(axis = 1).tolist()
+            else:
+                dirty = [True]*N
+            self._lastBlock = block.copy()
+
+            # Evaluate the sentinel on the RPM half of F for all fans at once
+            if sentinelFlag:
+                RPM = block if vector_i == 0 else np.asarray(
+                    F[:N*maxFans]).reshape(N, maxFans)
+                triggered = self._sentinelCheck(RPM)
+                triggered_rows = triggered.any(axis = 1).tolist()
+
+            # Row updates are gathered as flat (iid, values, tags) triplets
+            # and sent to Tcl in a single call. Unchanged rows are skipped,
+            # tags are only sent when they change and rows in which few
+            # values changed are updated cell by cell
+            updates, cells = [], []
+            push, pushCells = updates.extend, cells.extend
+            columnIDs = self._columnIDs
+
+            def stage(slave_i, values, tags):
+                if tags is not rowTags[slave_i]:
+                    rowTags[slave_i] = tags
+                    rowValues[slave_i] = values
+                    push((slaves[slave_i], values, tags))
+                elif values != rowValues[slave_i]:
+                    changed = [j for j, (new, old) in
+                        enumerate(zip(values, rowValues[slave_i])) if new != old]
+                    rowValues[slave_i] = values
+                    if 2*len(changed) < len(values):
+                        iid = slaves[slave_i]
+                        for j in changed:
+                            pushCells((iid, columnIDs[j], values[j]))
+                    else:
+                        push((slaves[slave_i], values, ()))
+
+            for slave_i in np.flatnonzero(rip).tolist():
+                # This slave is disconnected
+                stage(slave_i, rowPrefix[slave_i], tags_D[slave_i])
+
+            shown, shownTags = [], []
+            for slave_i in active.tolist():
+                # This slave is active
+                tags = tags_N[slave_i]
+                if sentinelFlag and triggered_rows[slave_i]:
+                    tags = tags_H[slave_i]
+                    for fan in np.flatnonzero(triggered[slave_i]).tolist():
+                        self._executeSentinel(slave_i, fan,
+                            RPM[slave_i, fan].item())
+                if dirty[slave_i] or tags is not rowTags[slave_i]:
+                    shown.append(slave_i)
+                    shownTags.append(tags)
+
+            rows = block[shown]
+            for slave_i, tags, values, high, low in zip(shown, shownTags,
+                rows.tolist(), rows.max(axis = 1).tolist(),
+                rows.min(axis = 1).tolist()):
+                stage(slave_i, rowPrefix[slave_i] + (high, low) + tuple(values),
+                    tags)
+
+            if updates or cells:
+                self.tk.call(self.BATCH_PROC, self.table, updates, cells)
+
+    @classmethod
+    def _getFont(cls):
+        """
+        Return the bold table font along with the widths of the RPM and
+        special columns, creating and measuring the font only once.
+        """
+        if cls._fontCache is None:
+            font = tk.font.Font(font = (gus.typography["code"]["font"][0],
+                gus.typography["code"]["font"][1], "bold"))
+            cls._fontCache = (font, font.measure("12345"),
+                font.measure("  Index  "))
+        return cls._fontCache
 
     @staticmethod
     def _const(dc):
@@ -4020,6 +4340,25 @@ class DataLogger(pt.PrintClient):
     STOP = -69
     S_I_NAME, S_I_MAC = 0, 1
 
+    # Rows are gathered in memory and written to the log file in blocks of
+    # about BUFFER_SIZE bytes, or after FLUSH_PERIOD_S seconds at the latest
+    BUFFER_SIZE = 1 << 20
+    FLUSH_PERIOD_S = 1.0
+
+    # Most vectors formatted together by the back-end when it falls behind
+    BATCH_SIZE = 64
+
+    # Most buffers handed to the writer thread and not yet on disk
+    MAX_WRITES = 4
+
+    # Feedback vectors waiting to be logged. Once full, new vectors are
+    # dropped rather than letting a slow back-end use up memory
+    QUEUE_SIZE = 256
+
+    # Slots in the shared memory ring that holds the vectors. A slot is only
+    # reused once it can no longer be in the queue or in the batch being read
+    RING_SIZE = QUEUE_SIZE + BATCH_SIZE + 1
+
 
     # NOTE:
     # - you cannot add slaves mid-print, as the back-end process takes only F's
@@ -4028,10 +4367,23 @@ class DataLogger(pt.PrintClient):
     def __init__(self, archive, pqueue):
         pt.PrintClient.__init__(self, pqueue)
 
-        self.pipeRecv, self.pipeSend = None, None
-        self._buildPipes()
+        self.queue = None
+        self._buildQueue()
         self.archive = archive
         self.process = None
+        self.dropped = 0
+
+        # Vectors are copied into a ring of shared memory slots, each holding
+        # the timestamp followed by F, and only slot indices are sent to the
+        # back-end. A new ring is made when the length of F changes:
+        self._rings = []
+        self._ring = None
+        self._ringColumns = -1
+        self._ringHead = 0
+
+        # Whether feedback should be sent to the back-end, kept by start and
+        # stop so that feedbackIn need not poll the process
+        self._active = False
 
         self.slaves = {}
 
@@ -4045,7 +4397,16 @@ class DataLogger(pt.PrintClient):
         try:
             if self.active():
                 self.stop(timeout)
-            self._buildPipes()
+            # A back-end that died without stop leaves its rings behind, and
+            # the new one must be told about a ring before any slot index
+            self._releaseRings()
+            self._ringHead = 0
+            self._buildQueue()
+            self.dropped = 0
+            if os.name == "posix":
+                # Have the back-end share this process' resource tracker, as
+                # one of its own would unlink the shared memory rings on exit
+                rt.ensure_running()
             arr = self.archive[ac.fanArray]
             self.process = mp.Process(
                 name = "FC_Log_Backend",
@@ -4054,9 +4415,10 @@ class DataLogger(pt.PrintClient):
                     filename, self.archive[ac.version], self.slaves,
                     self.archive[ac.name], self.archive[ac.maxFans],
                     (arr[ac.FA_rows], arr[ac.FA_columns], arr[ac.FA_layers]),
-                    self.pipeRecv, script, mappings, self.pqueue),
+                    self.queue, script, mappings, self.pqueue),
                 daemon = True,)
             self.process.start()
+            self._active = True
             self.prints("Data log started")
         except Exception as e:
             self.printx(e, "Exception activating data log:")
@@ -4066,15 +4428,20 @@ class DataLogger(pt.PrintClient):
         """
         Stop data logging.
         """
+        self._active = False
         try:
             if self.active():
                 self.printr("Stopping data log")
-                self._sendStop()
+                self._sendStop(timeout)
                 self.process.join(timeout)
                 if self.process.is_alive():
                     self.process.terminate()
                 self.process = None
                 self.printr("Data log stopped")
+                if self.dropped:
+                    self.printw("{} feedback vectors were not logged".format(
+                        self.dropped))
+            self._releaseRings()
         except Exception as e:
             self.printx(e, "Exception stopping data log:")
             self._sendStop()
@@ -4090,21 +4457,28 @@ class DataLogger(pt.PrintClient):
         Process the feedback vector F with timestamp t.
         """
         # FIXME: optm. time stamping
-        if self.active():
-            self.pipeSend.send((F, t))
+        if self._active:
+            if len(F) + 1 != self._ringColumns and not self._buildRing(
+                len(F) + 1):
+                self.dropped += 1
+                return
+            slot = self._ring[self._ringHead]
+            slot[0] = t
+            slot[1:] = F
+            try:
+                self.queue.put_nowait(self._ringHead)
+                self._ringHead = (self._ringHead + 1)%self.RING_SIZE
+            except qu.Full:
+                self.dropped += 1
 
     def slavesIn(self, S):
         """
         Process a slave data vector.
         """
-        length = len(S)
-        i = 0
-        while i < length:
-            index, name, mac = \
-                S[i + std.SD_INDEX] + 1, S[i + std.SD_NAME], S[i + std.SD_MAC]
-            if index not in self.slaves:
-                self.slaves[index] = (name, mac)
-            i += std.SD_LEN
+        slaves = self.slaves
+        slaves.update((index + 1, (name, mac)) for index, name, mac in zip(
+            S[std.SD_INDEX::std.SD_LEN], S[std.SD_NAME::std.SD_LEN],
+            S[std.SD_MAC::std.SD_LEN]) if index + 1 not in slaves)
 
     def networkIn(self, N):
         """
@@ -4113,21 +4487,70 @@ class DataLogger(pt.PrintClient):
         pass
 
     # Internal methods ---------------------------------------------------------
-    def _sendStop(self):
+    def _sendStop(self, timeout = std.MP_STOP_TIMEOUT_S):
         """
-        Send the stop signal.
+        Send the stop signal, waiting up to TIMEOUT seconds for room in the
+        queue.
         """
-        self.pipeSend.send(self.STOP)
+        try:
+            self.queue.put(self.STOP, timeout = timeout)
+        except qu.Full:
+            self.printe("Could not send stop signal to data log back-end")
 
-    def _buildPipes(self):
+    def _buildQueue(self):
         """
-        Reset the pipes. Do not use while the back-end is active.
+        Reset the queue. Do not use while the back-end is active.
         """
-        self.pipeRecv, self.pipeSend = mp.Pipe(False)
+        self.queue = mp.Queue(self.QUEUE_SIZE)
+
+    def _buildRing(self, columns):
+        """
+        Allocate a shared memory ring for vectors of COLUMNS values and tell
+        the back-end to read from it, without blocking. Previous rings are kept
+        until the log stops, as the back-end may not have read them yet. A ring
+        the back-end could not be told about is reused on the next attempt.
+        Return whether the back-end was told.
+        """
+        if self._ring is None or self._ring.shape[1] != columns:
+            memory = shm.SharedMemory(create = True,
+                size = self.RING_SIZE*columns*8)
+            self._rings.append(memory)
+            self._ring = np.ndarray((self.RING_SIZE, columns),
+                dtype = np.float64, buffer = memory.buf)
+        self._ringHead = 0
+        try:
+            self.queue.put_nowait((self._rings[-1].name, columns))
+        except qu.Full:
+            self._ringColumns = -1
+            return False
+        self._ringColumns = columns
+        return True
+
+    def _releaseRings(self):
+        """
+        Free the shared memory of all rings. Do not use while the back-end is
+        active.
+        """
+        self._ring = None
+        self._ringColumns = -1
+        for memory in self._rings:
+            memory.close()
+            memory.unlink()
+        self._rings.clear()
+
+    @staticmethod
+    def _writeAll(fd, data):
+        """
+        Write all of the bytes-like DATA to the file descriptor FD.
+        """
+        with memoryview(data) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
 
     @staticmethod
     def _routine(filename, version, slaves, profileName, maxFans, dimensions,
-        pipeRecv, script, mappings, pqueue):
+        queue, script, mappings, pqueue):
         """
         Routine executed by the back-end process.
         """
@@ -4139,67 +4562,130 @@ class DataLogger(pt.PrintClient):
         P = pt.PrintClient(pqueue)
         P.symbol = "[DR]"
         P.printr("Setting up data log")
-        with open(filename, 'w') as f:
-            # (Header) Log basic data:
-            f.write("Fan Club MkIV ({}) data log started on {}  using "\
-                "profile \"{}\"\n".format(
-                    version,tm.strftime("%a %d %b %Y %H:%M:%S", tm.localtime()),
-                    profileName))
-
-            # (Header) filename:
-            f.write("Filename: \"{}\"\n".format(filename))
-
-            # (Header) Module breakdown:
-            f.write("Modules: |")
-            rpm_boilerplate = ""
-            dc_boilerplate = ""
-            for fan in range(maxFans):
-                rpm_boilerplate += "s{0}" + "rpm{},".format(fan + 1)
-                dc_boilerplate += "s{0}" + "dc{},".format(fan + 1)
-            rpm_headers = ""
-            dc_headers = ""
-            for index, data in slaves.items():
-                name, mac = data
-                f.write("\"{}\": {} - \"{}\" | ".format(index, name, mac))
-                rpm_headers += rpm_boilerplate.format(index)
-                dc_headers += dc_boilerplate.format(index)
-            f.write("\n")
-
-            # (Header) Dimensions:
-            f.write("Dimensions (rows, columns, layers): {}x{}x{}\n".format(
-                *dimensions))
-
-            # (Header) Max fans:
-            f.write("Max Fans: {}\n".format(maxFans))
-
-            # (Header) Mappings:
-            f.write("Fan Array Mapping(s):\n")
-            for i, mapping in enumerate(mappings):
-                f.write("\tMapping {}: {}\n".format(i + 1, mapping))
-
-            # (Header) Functions in use:
-            fn_temp = "Script (Flattened. Replace ; for newline):\n"
-            f.write(fn_temp + script + "\n")
-
-            # Header (3/4)
-            f.write("Column headers are of the form s[MODULE#][type][FAN#]"\
-                "with type being first \"rpm\" and then all \"dc\"\n")
-
-            # Header (4/4):
-            f.write("Time (s)," + rpm_headers + dc_headers + "\n")
+
+        # Column headers:
+        rpm_boilerplate = "".join(
+            "s{{0}}rpm{},".format(fan + 1) for fan in range(maxFans))
+        dc_boilerplate = "".join(
+            "s{{0}}dc{},".format(fan + 1) for fan in range(maxFans))
+        rpm_headers = "".join(map(rpm_boilerplate.format, slaves))
+        dc_headers = "".join(map(dc_boilerplate.format, slaves))
+
+        # The header is composed as one string and written at once. The rows
+        # are then buffered by hand and written to the raw file descriptor,
+        # bypassing Python's file layers
+        header = "\n".join((
+            # Basic data:
+            "Fan Club MkIV ({}) data log started on {}  using "\
+                "profile \"{}\"".format(version,
+                tm.strftime("%a %d %b %Y %H:%M:%S", tm.localtime()),
+                profileName),
+            # Filename:
+            "Filename: \"{}\"".format(filename),
+            # Module breakdown:
+            "Modules: |" + "".join("\"{}\": {} - \"{}\" | ".format(
+                index, name, mac) for index, (name, mac) in slaves.items()),
+            # Dimensions:
+            "Dimensions (rows, columns, layers): {}x{}x{}".format(
+                *dimensions),
+            # Max fans:
+            "Max Fans: {}".format(maxFans),
+            # Mappings:
+            "Fan Array Mapping(s):",
+            *("\tMapping {}: {}".format(i + 1, mapping)
+                for i, mapping in enumerate(mappings)),
+            # Functions in use:
+            "Script (Flattened. Replace ; for newline):",
+            script,
+            # Column headers:
+            "Column headers are of the form s[MODULE#][type][FAN#]"\
+                "with type being first \"rpm\" and then all \"dc\"",
+            "Time (s)," + rpm_headers + dc_headers,
+            ""))
+
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            | getattr(os, 'O_BINARY', 0), 0o666)
+
+        # Full buffers are written by a separate thread, so that disk I/O
+        # overlaps with formatting the following rows
+        writer = cf.ThreadPoolExecutor(max_workers = 1)
+        writes = []
+        def write(data):
+            if len(writes) >= DataLogger.MAX_WRITES:
+                writes.pop(0).result()
+            writes.append(writer.submit(DataLogger._writeAll, fd, data))
+
+        memory, ring = None, None
+        try:
+            DataLogger._writeAll(fd, header.encode())
 
             P.prints("Data log online")
             t_start = tm.time()
-            while True:
-                # FIXME performance
-                data = pipeRecv.recv()
-                if data == DataLogger.STOP:
-                    break
-                F, t = data
-                f.write("{},".format(t - t_start))
-                for item in F:
-                    f.write("{},".format(item if item != -666 else 'NaN'))
-                f.write("\n")
+            buffer = bytearray()
+            t_flush = tm.monotonic() + DataLogger.FLUSH_PERIOD_S
+            fmt, template, template_key = None, "", None
+            running = True
+            while running:
+                # Take every vector already waiting, up to BATCH_SIZE, so
+                # that they are all formatted at once
+                batch = [queue.get()]
+                try:
+                    while len(batch) < DataLogger.BATCH_SIZE:
+                        batch.append(queue.get_nowait())
+                except qu.Empty:
+                    pass
+
+                # Slots are gathered per ring, as the front-end switches to a
+                # new ring when the length of the vectors changes
+                blocks, slots = [], []
+                for data in batch:
+                    if data == DataLogger.STOP:
+                        running = False
+                        break
+                    elif isinstance(data, tuple):
+                        if slots:
+                            blocks.append((ring[slots], fmt))
+                            slots = []
+                        ring = None
+                        if memory is not None:
+                            memory.close()
+                        name, columns = data
+                        memory = shm.SharedMemory(name)
+                        ring = np.ndarray((DataLogger.RING_SIZE, columns),
+                            dtype = np.float64, buffer = memory.buf)
+                        # The row template is fixed for the life of the ring
+                        fmt = "%.6f," + "%g,"*(columns - 1) + "\n"
+                    else:
+                        slots.append(data)
+                if slots:
+                    blocks.append((ring[slots], fmt))
+
+                # Blocks are formatted by their row template repeated once
+                # per row, which is kept while batches have the same size.
+                # Disconnected fans (-666) are then logged as NaN by
+                # substituting the formatted text, as every field ends in a
+                # comma and a minus sign can only start a field
+                for block, row in blocks:
+                    if template_key != (row, len(block)):
+                        template_key = (row, len(block))
+                        template = row*len(block)
+                    block[:, 0] -= t_start
+                    buffer += (template % tuple(block.ravel().tolist())
+                        ).replace("-666,", "NaN,").encode()
+                if len(buffer) >= DataLogger.BUFFER_SIZE \
+                    or tm.monotonic() >= t_flush:
+                    write(bytes(buffer))
+                    buffer.clear()
+                    t_flush = tm.monotonic() + DataLogger.FLUSH_PERIOD_S
+            write(bytes(buffer))
+            for future in writes:
+                future.result()
+        finally:
+            writer.shutdown()
+            os.close(fd)
+            ring = None
+            if memory is not None:
+                memory.close()
         P.printr("Data logger back-end ending")
 
 
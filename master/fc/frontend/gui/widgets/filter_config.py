@@ -38,28 +38,33 @@ import matplotlib
 # 配置matplotlib支持中文显示
 matplotlib.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial Unicode MS', 'DejaVu Sans']
 matplotlib.rcParams['axes.unicode_minus'] = False
+# 简化实时曲线路径并分块渲染，减少Agg绘制长曲线的开销；
+# 只在绘制本控件的两个图形时生效，不改变应用中其他图形的全局设置
+_PATH_RC = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
 import numpy as np
 import json
 import os
 import time
 import threading
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 import math
 
-# 尝试导入scipy，如果失败则设置为None
-try:
-    from scipy import signal
-    SCIPY_AVAILABLE = True
-except ImportError:
-    signal = None
-    SCIPY_AVAILABLE = False
+# scipy在首次设计滤波器时才由_import_scipy导入，避免拖慢GUI启动；
+# SCIPY_AVAILABLE为None表示尚未尝试导入
+signal = None
+_filtfilt = _lfilter = _lfilter_zi = None
+_sosfiltfilt = _sosfilt = _sosfilt_zi = None
+SCIPY_AVAILABLE = None
 
-# Import the filter configuration GUI components
-from fc.frontend.filter_config_gui import FilterConfigGUI
 from fc.backend.digital_filtering import FilterType, FilterMethod
 from fc import printer as pt
+from fc.frontend.gui.widgets import filter_kernels as fk
 
 # Import tach monitoring components
 try:
@@ -69,6 +74,88 @@ except ImportError:
     FC_COMM_AVAILABLE = False
     fcc = None
 
+def _to_float_array(values):
+    """把list/deque转换为float64数组，跳过其中的None；已是数组时直接返回"""
+    if isinstance(values, np.ndarray):
+        return np.asarray(values, dtype=np.float64)
+    if None not in values:
+        return np.fromiter(values, dtype=np.float64, count=len(values))
+    count = len(values) - values.count(None)
+    return np.fromiter((x for x in values if x is not None), dtype=np.float64, count=count)
+
+def _import_scipy():
+    """首次调用时导入scipy.signal，返回scipy是否可用"""
+    global signal, SCIPY_AVAILABLE, _filtfilt, _lfilter, _lfilter_zi, \
+        _sosfiltfilt, _sosfilt, _sosfilt_zi
+    if SCIPY_AVAILABLE is None:
+        try:
+            from scipy import signal
+        except ImportError:
+            SCIPY_AVAILABLE = False
+        else:
+            _filtfilt, _lfilter, _lfilter_zi = signal.filtfilt, signal.lfilter, signal.lfilter_zi
+            _sosfiltfilt, _sosfilt, _sosfilt_zi = signal.sosfiltfilt, signal.sosfilt, signal.sosfilt_zi
+            SCIPY_AVAILABLE = True
+    return SCIPY_AVAILABLE
+
+# design_filter返回的系数：IIR为二阶节sos数组 (n_sections, 6)，FIR为一维抽头b
+_FIR_DEN = np.ones(1)  # FIR滤波器的分母系数
+def _filter_zi(coefficients):
+    """单位阶跃稳态下的初始状态，乘以首个样本即为稳态初值"""
+    if coefficients.ndim == 2:
+        return _sosfilt_zi(coefficients)
+    return _lfilter_zi(coefficients, _FIR_DEN)
+
+def _causal_filter(coefficients, x, zi):
+    """沿最后一维因果滤波，返回 (输出, 末状态)；多路信号的状态沿倒数第二维排列"""
+    if coefficients.ndim == 2:
+        return _sosfilt(coefficients, x, axis=-1, zi=zi)
+    return _lfilter(coefficients, _FIR_DEN, x, axis=-1, zi=zi)
+
+def _zero_phase_filter(coefficients, x):
+    """沿最后一维零相位滤波；信号不长于默认填充长度时退回普通因果滤波"""
+    if coefficients.ndim == 2:
+        if x.shape[-1] > 3 * (2 * len(coefficients) + 1):
+            return _sosfiltfilt(coefficients, x, axis=-1)
+        return _sosfilt(coefficients, x, axis=-1)
+    if x.shape[-1] > 3 * len(coefficients):
+        return _filtfilt(coefficients, _FIR_DEN, x, axis=-1)
+    return _lfilter(coefficients, _FIR_DEN, x, axis=-1)
+
+def _band_edges(wn):
+    """带通/带阻滤波器的归一化边界频率：截止频率两侧各0.1"""
+    low = max(0.01, wn - 0.1)
+    high = min(0.99, wn + 0.1)
+    if low >= high:
+        low, high = wn * 0.8, wn * 1.2
+    return [low, high]
+
+def _envelope(x, y, width):
+    """
+    把曲线抽取到约2*width个点：每个像素宽的区间只保留最小值和最大值
+    （按原顺序），保留尖峰的同时减少Agg描线的点数。最旧的不足一个区间的点被丢弃。
+    """
+    n = len(y)
+    if n <= 2 * width:
+        return x, y
+    stride = n // width
+    start = n - (n // stride) * stride
+    buckets = np.asarray(y[start:]).reshape(-1, stride)
+    lo = buckets.argmin(axis=1)
+    hi = buckets.argmax(axis=1)
+    index = np.empty((len(buckets), 2), dtype=np.intp)
+    index[:, 0] = np.minimum(lo, hi)
+    index[:, 1] = np.maximum(lo, hi)
+    index += (start + stride * np.arange(len(buckets)))[:, None]
+    index = index.ravel()
+    return x[index], y[index]
+
+class _FilterFigure(Figure):
+    """完整重绘时临时应用_PATH_RC的图形"""
+    def draw(self, renderer):
+        with matplotlib.rc_context(_PATH_RC):
+            super().draw(renderer)
+
 @dataclass
 class TachReading:
     """Tach信号读数数据结构"""
@@ -84,6 +171,36 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
     """滤波器配置组件，集成到主GUI中"""
     
     SYMBOL = "[FC]"
+    FILTER_HISTORY = 1000  # 每个风机保留的滤波结果点数
+    COEFF_CACHE_SIZE = 32  # 缓存的滤波器系数组数
+    # 滤波器设计表：(方法, 类型) -> 由 (阶数, 归一化截止频率) 得到系数
+    _DESIGN = {
+        ('BUTTERWORTH', 'LOWPASS'): lambda order, wn: signal.butter(order, wn, btype='low', output='sos'),
+        ('BUTTERWORTH', 'HIGHPASS'): lambda order, wn: signal.butter(order, wn, btype='high', output='sos'),
+        ('BUTTERWORTH', 'BANDPASS'): lambda order, wn: signal.butter(order, _band_edges(wn), btype='band', output='sos'),
+        ('BUTTERWORTH', 'BANDSTOP'): lambda order, wn: signal.butter(order, _band_edges(wn), btype='bandstop', output='sos'),
+        ('CHEBYSHEV1', 'LOWPASS'): lambda order, wn: signal.cheby1(order, 1.0, wn, btype='low', output='sos'),  # 1dB ripple
+        ('CHEBYSHEV1', 'HIGHPASS'): lambda order, wn: signal.cheby1(order, 1.0, wn, btype='high', output='sos'),
+        # FIR长度限制在101以内以提高性能
+        ('FIR', 'LOWPASS'): lambda order, wn: np.asarray(
+            signal.firwin(min(order + 1, 101), wn, window='hamming'), dtype=np.float64),
+        ('FIR', 'HIGHPASS'): lambda order, wn: np.asarray(
+            signal.firwin(min(order + 1, 101), wn, window='hamming', pass_zero=False), dtype=np.float64),
+    }
+    for _type in ('LOWPASS', 'HIGHPASS', 'BANDPASS', 'BANDSTOP'):
+        _DESIGN[('IIR', _type)] = _DESIGN[('BUTTERWORTH', _type)]
+    del _type
+    
+    # 由递推内核实现的滤波方法：方法名 -> (内核, 从配置取参数)
+    _KERNEL_METHODS = {
+        "HUBER_ROBUST": (fk.huber_filter, lambda c: (
+            float(c['huber_threshold']), int(c['huber_window_size']))),
+        "ALPHA_BETA": (fk.alpha_beta, lambda c: (
+            float(c['alpha_factor']), float(c['beta_factor']),
+            1.0 / float(c['sampling_rate']))),
+        "KALMAN": (fk.kalman, lambda c: (
+            float(c['process_noise']), float(c['observation_noise']))),
+    }
     
     def __init__(self, master, archive=None, pqueue=None, monitoring_widget=None):
         """
@@ -106,6 +223,24 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         # 滤波器配置相关
         self.filtered_data = {}  # 存储滤波后的数据
         self.update_rate = 10.0  # 10Hz更新率
+        self._update_interval_ms = 100  # 滤波更新间隔，随更新率变化
+        self._draw_interval_ms = 66  # 图表刷新间隔（约15Hz），与滤波更新率分开
+        self._last_draw_ts = 0.0
+        self._drawing = False
+        self._pending_update_id = None  # 等待中的频率响应更新（after id）
+        self._last_seen = {}  # 每个风机上次滤波时的 (样本数, 最后时间戳)
+        self._zi = {}  # 每个风机的滤波状态 (zi, 已滤波的最后时间戳)
+        self._zi_key = None  # _zi对应的系数配置键
+        self._zi_unit = None  # 该系数的单位稳态初值
+        self._plot_stale = True  # 是否有尚未绘制的新数据
+        self._debug = bool(os.environ.get('FC_FILTER_DEBUG'))  # 出错时是否打印完整traceback
+        self._config = None  # 缓存的当前配置，参数变量写入时失效
+        self._coeff_cache = OrderedDict()  # 已设计的滤波器系数 {配置键: sos或FIR抽头}，LRU顺序
+        self._freq_grid = (None, None)  # 频率响应网格 ((采样率, 点数), 对数频率点)
+        self._freq_key = None  # 当前频率响应图对应的配置键
+        self._freq_pending = False  # 频率响应图不可见时推迟的更新
+        self._mag_db = np.empty(0)  # 幅度响应（dB）计算缓冲区
+        self._mag_tmp = np.empty(0)
         
         # 从monitoring组件获取enabled_fans配置，如果不可用则使用默认值
         if self.monitoring_widget and hasattr(self.monitoring_widget, 'tach_config'):
@@ -282,7 +417,7 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         self.freq_plot_frame = ttk.LabelFrame(self.display_frame, text="频率响应", padding=5)
         
         # 创建matplotlib图形
-        self.freq_fig = Figure(figsize=(6, 4), dpi=100)
+        self.freq_fig = _FilterFigure(figsize=(6, 4), dpi=100)
         self.freq_ax = self.freq_fig.add_subplot(111)
         self.freq_canvas = FigureCanvasTkAgg(self.freq_fig, self.freq_plot_frame)
         self.freq_canvas.get_tk_widget().pack(fill="both", expand=True)
@@ -292,13 +427,23 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         self.freq_ax.set_ylabel("幅度 (dB)")
         self.freq_ax.set_title("频率响应")
         self.freq_ax.grid(True)
+        
+        # 幅度曲线与截止频率线为动画对象，静态部分不变时只blit这几个对象
+        self._mag_line = None
+        self._freq_scaffold = None  # 静态部分对应的 (采样率, 标题)
+        self._freq_bg = None
+        self.freq_canvas.mpl_connect('draw_event', self._on_freq_draw)
+        # <Visibility> 只在X11上产生；顶层窗口的 <Map> 绑定会收到窗口内任一控件
+        # （包括切换到的标签页）被映射的事件，在各平台上都可用；destroy时移除
+        self._map_toplevel = self.freq_canvas.get_tk_widget().winfo_toplevel()
+        self._map_funcid = self._map_toplevel.bind('<Map>', self._on_freq_visible, add='+')
     
     def create_time_domain_plot(self):
         """创建时域预览图（显示实时tach数据）"""
         self.time_plot_frame = ttk.LabelFrame(self.display_frame, text="实时Tach信号监控", padding=5)
         
         # 创建matplotlib图形
-        self.time_fig = Figure(figsize=(8, 5), dpi=100)
+        self.time_fig = _FilterFigure(figsize=(8, 5), dpi=100)
         self.time_ax = self.time_fig.add_subplot(111)
         self.time_canvas = FigureCanvasTkAgg(self.time_fig, self.time_plot_frame)
         self.time_canvas.get_tk_widget().pack(fill="both", expand=True)
@@ -311,6 +456,14 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         self.time_ax.set_title("实时Tach信号监控")
         self.time_ax.grid(True, alpha=0.3)
         
+        # 持久曲线与blit背景：每次draw后重新截取背景
+        self._raw_lines = {}
+        self._filt_lines = {}
+        self._time_bg = None
+        self._plot_px_width = 600  # 坐标区像素宽度，每次完整重绘后更新
+        self.time_canvas.mpl_connect('draw_event', self._on_time_draw)
+        self._build_time_lines()
+        
         # 添加tach数据控制面板
         self.create_tach_control_panel()
         
@@ -340,6 +493,18 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         self.rate_label = ttk.Label(rate_frame, text="10.0")
         self.rate_label.pack(side="left")
         
+        # 图表刷新率控制
+        draw_rate_frame = ttk.Frame(self.tach_control_frame)
+        draw_rate_frame.pack(fill="x", pady=2)
+        
+        ttk.Label(draw_rate_frame, text="刷新率(Hz):").pack(side="left")
+        self.draw_rate_var = tk.DoubleVar(value=15.0)
+        self.draw_rate_scale = ttk.Scale(draw_rate_frame, from_=1.0, to=30.0,
+                                        variable=self.draw_rate_var, orient="horizontal")
+        self.draw_rate_scale.pack(side="left", fill="x", expand=True, padx=5)
+        self.draw_rate_label = ttk.Label(draw_rate_frame, text="15.0")
+        self.draw_rate_label.pack(side="left")
+        
         # 控制按钮
         button_frame = ttk.Frame(self.tach_control_frame)
         button_frame.pack(fill="x", pady=5)
@@ -361,6 +526,7 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         
         # 绑定事件
         self.rate_scale.configure(command=self.on_rate_change)
+        self.draw_rate_scale.configure(command=self.on_draw_rate_change)
         self.fan_entry.bind('<Return>', self.on_fan_selection_change)
      
     def create_status_bar(self):
@@ -408,10 +574,19 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         # 滤波方法变化时更新参数显示
         self.filter_method_var.trace('w', self.on_filter_method_change)
         
-        # 绑定参数变化事件
-        for var in [self.filter_type_var, self.filter_method_var, self.sampling_rate_var, 
-                   self.cutoff_freq_var, self.order_var]:
-            var.trace('w', self.update_plots)
+        # 任一参数变量被写入时使缓存的配置失效
+        for var in [self.filter_type_var, self.filter_method_var, self.sampling_rate_var,
+                    self.cutoff_freq_var, self.order_var, self.process_noise_var,
+                    self.observation_noise_var, self.huber_threshold_var, self.huber_window_var,
+                    self.alpha_var, self.beta_var]:
+            var.trace_add('write', self._invalidate_config)
+        
+        # 绑定参数变化事件：输入框在确认或失去焦点后延迟更新，避免每次按键都重新设计滤波器
+        for entry in [self.sampling_rate_entry, self.cutoff_freq_entry, self.order_entry]:
+            entry.bind('<FocusOut>', self._debounced_update)
+            entry.bind('<Return>', self._debounced_update)
+        for combo in [self.filter_type_combo, self.filter_method_combo]:
+            combo.bind('<<ComboboxSelected>>', lambda event: self._schedule_update())
              
         # 延迟初始化频率响应图，避免启动时卡顿
         try:
@@ -421,9 +596,27 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
             # Widget destroyed or error, skip scheduling
             pass
     
+    def _schedule_update(self, delay_ms=80):
+        """合并短时间内的多次更新请求，在最后一次请求delay_ms后更新频率响应图"""
+        if self._pending_update_id is not None:
+            self.after_cancel(self._pending_update_id)
+        self._pending_update_id = self.after(delay_ms, self._run_pending_update)
+    
+    def _debounced_update(self, *args):
+        """输入框事件：在最后一次输入300ms后更新"""
+        self._schedule_update(300)
+    
+    def _run_pending_update(self):
+        self._pending_update_id = None
+        self._last_seen.clear()
+        self._zi.clear()
+        self.safe_update_plots()
+    
     def on_filter_method_change(self, *args):
         """滤波方法变化时的回调"""
         method = self.filter_method_var.get()
+        self._last_seen.clear()
+        self._zi.clear()
         
         # 隐藏所有高级参数框架
         for frame in [self.kalman_frame, self.huber_frame, self.alpha_beta_frame]:
@@ -443,10 +636,7 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         # 初始化滤波数据存储
         for fan_id in self.enabled_fans:
             if fan_id not in self.filtered_data:
-                self.filtered_data[fan_id] = {
-                    'timestamps': deque(maxlen=1000),
-                    'filtered_rpm': deque(maxlen=1000)
-                }
+                self.filtered_data[fan_id] = self._new_filtered_buffer()
         
         # 如果monitoring组件已经在运行tach监控，启动滤波器更新
         if self.is_tach_monitoring_active():
@@ -492,10 +682,6 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
             if not hasattr(self, 'master') or not hasattr(self.master, 'winfo_exists') or not self.master.winfo_exists():
                 return
                 
-            # Check if we have the necessary methods
-            if not hasattr(self, 'is_tach_monitoring_active') or not hasattr(self, 'update_filtered_data'):
-                return
-                
             if self.is_tach_monitoring_active():
                 try:
                     self.update_filtered_data()
@@ -504,13 +690,8 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
                     return
                     
                 # 使用tkinter的after方法调度下次更新
-                update_interval = int(1000 / self.update_rate)  # 转换为毫秒
                 try:
-                    # Double check before scheduling
-                    if (hasattr(self, 'winfo_exists') and self.winfo_exists() and 
-                        hasattr(self, 'is_tach_monitoring_active') and self.is_tach_monitoring_active() and
-                        hasattr(self, 'after')):
-                        self.after(update_interval, self.schedule_filter_update)
+                    self.after(self._update_interval_ms, self.schedule_filter_update)
                 except (tk.TclError, AttributeError, RuntimeError):
                     # Failed to schedule, stop updating
                     pass
@@ -549,20 +730,29 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
                 self.printd("无可用的tach数据进行滤波")
                 return
             
+            # 按信号长度分组，同长度风机的信号叠成二维数组一次滤波
+            groups = {}
             for fan_id in self.enabled_fans:
-                if fan_id in tach_data and tach_data[fan_id].get('raw_signals'):
+                if fan_id in tach_data and len(tach_data[fan_id]['raw_signals']):
                     raw_signals = tach_data[fan_id]['raw_signals']
                     timestamps = tach_data[fan_id]['timestamps']
                     
                     # 验证数据有效性
-                    if not raw_signals or not timestamps or len(raw_signals) != len(timestamps):
+                    if len(timestamps) == 0 or len(raw_signals) != len(timestamps):
                         self.printd(f"Fan {fan_id}: 数据无效或长度不匹配")
                         continue
                     
-                    # 转换为列表并验证数据类型
+                    # 没有新样本时跳过（monitoring的采集可能慢于滤波更新）
+                    key = (len(timestamps), timestamps[-1])
+                    if self._last_seen.get(fan_id) == key:
+                        continue
+                    self._last_seen[fan_id] = key
+                    self._plot_stale = True
+                    
+                    # 转换为float64数组并验证数据类型
                     try:
-                        raw_signals = [float(x) for x in raw_signals if x is not None]
-                        timestamps = [float(t) for t in timestamps if t is not None]
+                        raw_signals = _to_float_array(raw_signals)
+                        timestamps = _to_float_array(timestamps)
                         
                         if len(raw_signals) < 2:
                             self.printd(f"Fan {fan_id}: 数据点不足，跳过滤波")
@@ -572,133 +762,274 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
                         self.printd(f"Fan {fan_id}: 数据类型转换错误: {e}")
                         continue
                     
-                    # 应用滤波器到原始信号
-                    filtered_rpm = self._apply_filter_to_signal(raw_signals, filter_type, config)
+                    if not np.isfinite(raw_signals).all():
+                        self.printd(f"Fan {fan_id}: 信号包含无效数值（NaN或Inf），跳过滤波")
+                        continue
                     
-                    if filtered_rpm:
-                        # 存储滤波后的数据
-                        if fan_id not in self.filtered_data:
-                            self.filtered_data[fan_id] = {
-                                'timestamps': deque(maxlen=1000),
-                                'filtered_rpm': deque(maxlen=1000)
-                            }
-                        
-                        self.filtered_data[fan_id]['timestamps'] = deque(timestamps, maxlen=1000)
-                        self.filtered_data[fan_id]['filtered_rpm'] = deque(filtered_rpm, maxlen=1000)
+                    groups.setdefault(len(raw_signals), []).append((fan_id, raw_signals, timestamps))
+            
+            if filter_type != "moving_average" and \
+                    config['filter_method'] not in self._KERNEL_METHODS:
+                # 系数型滤波器（IIR/FIR）逐段流式滤波，只处理新到达的样本
+                self._stream_filter([fan for group in groups.values() for fan in group], config)
+                return
+            
+            for group in groups.values():
+                # 应用滤波器到原始信号（每行一个风机）
+                signals = np.vstack([raw_signals for _, raw_signals, _ in group])
+                filtered = self._apply_filter_to_signal(signals, filter_type, config)
+                
+                if filtered is None or len(filtered) != len(group):
+                    for fan_id, _, _ in group:
+                        self._last_seen.pop(fan_id, None)
+                    continue
+                
+                for (fan_id, _, timestamps), filtered_rpm in zip(group, filtered):
+                    # 存储滤波后的数据（只保留最近FILTER_HISTORY个点）
+                    if fan_id not in self.filtered_data:
+                        self.filtered_data[fan_id] = self._new_filtered_buffer()
+                    
+                    entry = self.filtered_data[fan_id]
+                    entry['n'] = 0
+                    self._append_filtered(entry, timestamps, filtered_rpm)
                         
         except Exception as e:
             self.printd(f"滤波器应用错误: {e}")
-            import traceback
-            self.printd(f"详细错误信息: {traceback.format_exc()}")
+            if self._debug:
+                import traceback
+                self.printd(f"详细错误信息: {traceback.format_exc()}")
+            
+    def _stream_filter(self, fans, config):
+        """
+        用每个风机保存的滤波状态zi因果滤波，只处理上次之后到达的样本；
+        首次滤波或数据不连续时以第一个样本为稳态初值滤波整个窗口。
+        fans为 (fan_id, raw_signals, timestamps) 列表。
+        """
+        coefficients = self._get_coefficients(config)
+        if coefficients is None:
+            for fan_id, _, _ in fans:
+                self._last_seen.pop(fan_id, None)
+            return
+        
+        # 系数变化后已保存的状态不再适用，所有风机从当前窗口重新初始化
+        key = self._coeff_key(config)
+        if key != self._zi_key:
+            self._zi.clear()
+            self._zi_key = key
+            self._zi_unit = _filter_zi(coefficients)
+        zi_unit = self._zi_unit
+        steps = {}  # 新样本数 -> [(fan_id, 新信号, 新时间戳, zi)]
+        for fan_id, raw_signals, timestamps in fans:
+            if fan_id not in self.filtered_data:
+                self.filtered_data[fan_id] = self._new_filtered_buffer()
+            entry = self.filtered_data[fan_id]
+            
+            state = self._zi.get(fan_id)
+            start = 0
+            if state is not None and entry['n']:
+                start = np.searchsorted(timestamps, state[1], side='right')
             
-    def _apply_filter_to_signal(self, signal, filter_type, config):
-        """对信号应用滤波器"""
-        if not signal or len(signal) < 2:
+            if start == 0:
+                filtered, zi = _causal_filter(coefficients, raw_signals, zi_unit * raw_signals[0])
+                entry['n'] = 0
+                self._append_filtered(entry, timestamps, filtered)
+                self._zi[fan_id] = (zi, timestamps[-1])
+            elif start < len(timestamps):
+                steps.setdefault(len(timestamps) - start, []).append(
+                    (fan_id, raw_signals[start:], timestamps[start:], state[0]))
+        
+        # 新样本数相同的风机叠成二维数组一次滤波
+        for group in steps.values():
+            signals = np.vstack([new_signals for _, new_signals, _, _ in group])
+            states = np.stack([zi for _, _, _, zi in group], axis=-2)
+            filtered, states = _causal_filter(coefficients, signals, states)
+            for i, ((fan_id, _, timestamps, _), filtered_rpm) in enumerate(zip(group, filtered)):
+                zi = states[..., i, :]
+                self._append_filtered(self.filtered_data[fan_id], timestamps, filtered_rpm)
+                self._zi[fan_id] = (zi, timestamps[-1])
+    
+    def _append_filtered(self, entry, timestamps, filtered_rpm):
+        """把新的滤波结果追加到缓冲区末尾，超出FILTER_HISTORY时丢弃最旧的点"""
+        k = min(len(filtered_rpm), self.FILTER_HISTORY)
+        if not k:
+            return
+        keep = min(entry['n'], self.FILTER_HISTORY - k)
+        n = entry['n']
+        if keep and keep != n:
+            entry['t'][:keep] = entry['t'][n - keep:n]
+            entry['y'][:keep] = entry['y'][n - keep:n]
+        entry['t'][keep:keep + k] = timestamps[-k:]
+        entry['y'][keep:keep + k] = filtered_rpm[-k:]
+        entry['n'] = keep + k
+    
+    def _apply_filter_to_signal(self, samples, filter_type, config):
+        """
+        对信号应用滤波器，返回float64数组；二维输入时每行为一路信号，
+        沿最后一维滤波。无法滤波时原样返回输入。
+        """
+        if samples is None:
             self.printd("信号数据不足，无法进行滤波")
-            return signal
+            return samples
             
         try:
             # 验证信号数据
-            if not all(isinstance(x, (int, float)) and not (isinstance(x, float) and (x != x or abs(x) == float('inf'))) for x in signal):
+            try:
+                signal_data = np.asarray(samples, dtype=np.float64)
+            except (ValueError, TypeError):
+                self.printd("信号包含非数值数据，跳过滤波")
+                return samples
+            if signal_data.ndim == 0 or signal_data.shape[-1] < 2:
+                self.printd("信号数据不足，无法进行滤波")
+                return samples
+            if not np.isfinite(signal_data).all():
                 self.printd("信号包含无效数值（NaN或Inf），跳过滤波")
-                return signal
-            
-            signal_data = np.array(signal)
+                return samples
             
             if filter_type == "moving_average":
-                window_size = max(1, min(config.get('window_size', 5), len(signal)))
-                filtered = []
-                for i in range(len(signal)):
-                    start_idx = max(0, i - window_size + 1)
-                    window = signal[start_idx:i+1]
-                    if window:  # 确保窗口不为空
-                        filtered.append(sum(window) / len(window))
-                    else:
-                        filtered.append(signal[i])
-                return filtered
+                window_size = max(1, min(config.get('window_size', 5), signal_data.shape[-1]))
+                return fk.moving_average(signal_data, window_size)
+            elif config.get('filter_method') in self._KERNEL_METHODS:
+                # 递推内核写入预分配的输出，二维输入时各风机并行滤波
+                kernel, params = self._KERNEL_METHODS[config['filter_method']]
+                return kernel(signal_data, np.empty_like(signal_data), *params(config))
             else:
                 # 使用设计的滤波器进行滤波
-                b, a = self.design_filter(config)
+                coefficients = self._get_coefficients(config)
                 
-                if b is not None and a is not None:
-                    try:
-                        # 使用filtfilt进行零相位滤波
-                        filtered_signal = signal.filtfilt(b, a, signal_data)
-                        return filtered_signal.tolist()
-                    except Exception as filter_error:
-                        self.printd(f"filtfilt失败，使用lfilter: {filter_error}")
-                        try:
-                            # 如果filtfilt失败，使用普通滤波
-                            filtered_signal = signal.lfilter(b, a, signal_data)
-                            return filtered_signal.tolist()
-                        except Exception as lfilter_error:
-                            self.printd(f"lfilter也失败: {lfilter_error}")
-                            return signal
+                if coefficients is not None:
+                    return _zero_phase_filter(coefficients, signal_data)
                 else:
                     self.printd("滤波器设计失败，使用原始信号")
-                    return signal
+                    return samples
                 
         except Exception as e:
             self.printd(f"滤波器计算错误: {e}")
-            import traceback
-            self.printd(f"详细错误: {traceback.format_exc()}")
-            return signal
+            if self._debug:
+                import traceback
+                self.printd(f"详细错误: {traceback.format_exc()}")
+            return samples
             
+    def _build_time_lines(self):
+        """为前4个启用的风机创建持久的原始/滤波曲线，之后只更新数据并blit"""
+        for line in list(self._raw_lines.values()) + list(self._filt_lines.values()):
+            line.remove()
+        self._raw_lines = {}
+        self._filt_lines = {}
+        
+        colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray']
+        for fan_id, color in zip(self.enabled_fans[:4], colors):  # 最多显示4个风机
+            self._raw_lines[fan_id], = self.time_ax.plot([], [], color=color, alpha=0.5, linewidth=1,
+                                                         label=f'Fan {fan_id} 原始', animated=True)
+            self._filt_lines[fan_id], = self.time_ax.plot([], [], color=color, linewidth=2,
+                                                          label=f'Fan {fan_id} 滤波', animated=True)
+        
+        if self._raw_lines:
+            self.time_ax.legend(loc='upper right')
+        elif self.time_ax.get_legend() is not None:
+            self.time_ax.get_legend().remove()
+        self.time_ax.set_xlim(0, 1)
+        self.time_ax.set_ylim(0, 1)
+        self.time_canvas.draw()
+        self._last_seen.clear()
+        self._zi.clear()
+        self._plot_stale = True
+    
+    def _on_time_draw(self, event):
+        """完整重绘后截取不含曲线的背景，并把曲线画回去"""
+        self._time_bg = self.time_canvas.copy_from_bbox(self.time_ax.bbox)
+        self._plot_px_width = max(1, int(self.time_ax.bbox.width))
+        self._draw_time_lines()
+    
+    def _draw_time_lines(self):
+        with matplotlib.rc_context(_PATH_RC):
+            for line in self._raw_lines.values():
+                self.time_ax.draw_artist(line)
+            for line in self._filt_lines.values():
+                self.time_ax.draw_artist(line)
+    
+    def _fit_time_limits(self, x_max, y_min, y_max):
+        """数据超出当前坐标范围时扩展坐标轴，返回是否需要完整重绘"""
+        x_low, x_high = self.time_ax.get_xlim()
+        y_low, y_high = self.time_ax.get_ylim()
+        if x_max <= x_high and y_low <= y_min and y_max <= y_high:
+            return False
+        
+        margin = 0.1 * (y_max - y_min) or 1.0
+        self.time_ax.set_xlim(0, max(x_high, x_max * 1.2) or 1.0)
+        self.time_ax.set_ylim(min(y_low, y_min - margin), max(y_high, y_max + margin))
+        return True
+    
     def _update_tach_plots(self):
-        """更新tach数据图表"""
+        """更新tach数据图表（按刷新率节流，滤波本身不受影响）"""
+        now = time.monotonic()
+        if not self._plot_stale or self._drawing \
+                or now - self._last_draw_ts < self._draw_interval_ms / 1000:
+            return
+        self._drawing = True
+        self._last_draw_ts = now
+        self._plot_stale = False
         try:
             if hasattr(self, 'time_canvas') and self.time_canvas:
-                # 清除当前图表
-                self.time_ax.clear()
-                self.time_ax.set_title('实时Tach信号监控', fontsize=12)
-                self.time_ax.set_xlabel('时间 (s)')
-                self.time_ax.set_ylabel('RPM')
-                self.time_ax.grid(True, alpha=0.3)
-                
                 # 获取monitoring组件的tach数据
                 tach_data = self.get_tach_data()
                 
-                # 绘制原始和滤波后的数据
-                colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray']
-                
-                for i, fan_id in enumerate(self.enabled_fans[:4]):  # 最多显示4个风机
-                    if fan_id in tach_data and tach_data[fan_id]['timestamps']:
-                        timestamps = list(tach_data[fan_id]['timestamps'])
-                        raw_signals = list(tach_data[fan_id]['raw_signals'])  # 使用原始信号
-                        
-                        # 转换为相对时间
-                        if timestamps:
-                            base_time = timestamps[0]
-                            rel_times = [(t - base_time) for t in timestamps]
-                            
-                            color = colors[i % len(colors)]
-                            
-                            # 绘制原始raw signal数据
-                            self.time_ax.plot(rel_times, raw_signals, 
-                                            color=color, alpha=0.5, linewidth=1,
-                                            label=f'Fan {fan_id} 原始')
-                            
-                            # 绘制滤波后的数据
-                            if fan_id in self.filtered_data and self.filtered_data[fan_id]['filtered_rpm']:
-                                filtered_rpm = list(self.filtered_data[fan_id]['filtered_rpm'])
-                                self.time_ax.plot(rel_times, filtered_rpm,
-                                                color=color, linewidth=2,
-                                                label=f'Fan {fan_id} 滤波')
+                # 更新原始和滤波后的曲线数据
+                x_max, y_min, y_max = 0.0, np.inf, -np.inf
+                for fan_id, raw_line in self._raw_lines.items():
+                    filt_line = self._filt_lines[fan_id]
+                    if not (fan_id in tach_data and len(tach_data[fan_id]['timestamps'])):
+                        raw_line.set_data([], [])
+                        filt_line.set_data([], [])
+                        continue
+                    
+                    # 复制一份：曲线会持有数据引用，而缓冲区视图在之后的追加中会被覆盖
+                    timestamps = np.array(tach_data[fan_id]['timestamps'], dtype=np.float64)
+                    raw_signals = np.array(tach_data[fan_id]['raw_signals'], dtype=np.float64)  # 使用原始信号
+                    
+                    # 转换为相对时间
+                    rel_times = timestamps - timestamps[0]
+                    raw_line.set_data(*_envelope(rel_times, raw_signals, self._plot_px_width))
+                    
+                    x_max = max(x_max, rel_times[-1])
+                    if np.isfinite(raw_signals).any():
+                        y_min = min(y_min, np.nanmin(raw_signals))
+                        y_max = max(y_max, np.nanmax(raw_signals))
+                    
+                    # 滤波数据可能比原始数据旧，按末尾对齐
+                    entry = self.filtered_data.get(fan_id)
+                    if entry is not None and entry['n']:
+                        n = min(entry['n'], len(rel_times))
+                        filt_line.set_data(*_envelope(rel_times[-n:], entry['y'][entry['n'] - n:entry['n']],
+                                                      self._plot_px_width))
+                    else:
+                        filt_line.set_data([], [])
                 
-                # 只有当有数据绘制时才显示图例
-                handles, labels = self.time_ax.get_legend_handles_labels()
-                if handles:
-                    self.time_ax.legend()
-                self.time_canvas.draw()
+                if y_min <= y_max and self._fit_time_limits(x_max, y_min, y_max) \
+                        or self._time_bg is None:
+                    # 坐标轴变化时完整重绘（draw_event中重新截取背景）
+                    self.time_canvas.draw()
+                else:
+                    self.time_canvas.restore_region(self._time_bg)
+                    self._draw_time_lines()
+                    self.time_canvas.blit(self.time_ax.bbox)
                 
         except Exception as e:
             self.printd(f"图表更新错误: {e}")
+        finally:
+            self._drawing = False
             
     def on_rate_change(self, value):
         """更新率变化事件"""
         rate = float(value)
         self.rate_label.config(text=f"{rate:.1f}")
         self.update_rate = rate
+        self._update_interval_ms = max(10, int(1000.0 / rate))
+        
+    def on_draw_rate_change(self, value):
+        """图表刷新率变化事件"""
+        rate = float(value)
+        self.draw_rate_label.config(text=f"{rate:.1f}")
+        self._draw_interval_ms = int(1000 / rate)
         
     def on_fan_selection_change(self, event=None):
         """风机选择变化事件"""
@@ -712,6 +1043,7 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
                 self.printw(f"无效的风机ID已被过滤，有效范围: 0-31")
             
             self.enabled_fans = valid_fans
+            self._build_time_lines()
             
             # 同步更新monitoring组件的enabled_fans配置
             if self.monitoring_widget and hasattr(self.monitoring_widget, 'tach_config'):
@@ -722,16 +1054,14 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
             # 重新初始化滤波数据存储
             for fan_id in self.enabled_fans:
                 if fan_id not in self.filtered_data:
-                    self.filtered_data[fan_id] = {
-                        'timestamps': deque(maxlen=1000),
-                        'filtered_rpm': deque(maxlen=1000)
-                    }
+                    self.filtered_data[fan_id] = self._new_filtered_buffer()
             
             self.printd(f"滤波器监控风机已更新: {self.enabled_fans}")
             
         except Exception as e:
             self.printw(f"风机选择格式错误: {e}")
             self.enabled_fans = [0, 1, 2, 3]  # 默认值
+            self._build_time_lines()
             
     def update_monitoring_status(self):
         """更新监控状态显示"""
@@ -757,37 +1087,57 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         # 清除滤波数据
         for fan_id in self.enabled_fans:
             if fan_id in self.filtered_data:
-                self.filtered_data[fan_id]['timestamps'].clear()
-                self.filtered_data[fan_id]['filtered_rpm'].clear()
+                self.filtered_data[fan_id]['n'] = 0
         
         # 清除monitoring组件的tach数据
         if self.monitoring_widget and hasattr(self.monitoring_widget, 'tach_data'):
-            for fan_id in self.monitoring_widget.tach_data:
-                self.monitoring_widget.tach_data[fan_id]['timestamps'].clear()
-                self.monitoring_widget.tach_data[fan_id]['rpm_values'].clear()
-                self.monitoring_widget.tach_data[fan_id]['filtered_rpm'].clear()
-                self.monitoring_widget.tach_data[fan_id]['duty_cycles'].clear()
-                self.monitoring_widget.tach_data[fan_id]['timeouts'].clear()
-                self.monitoring_widget.tach_data[fan_id]['raw_signals'].clear()
+            for data in self.monitoring_widget.tach_data.values():
+                data.clear()
         
         # 清除图表
-        self.time_ax.clear()
-        self.time_ax.set_xlabel("时间 (s)")
-        self.time_ax.set_ylabel("RPM")
-        self.time_ax.set_title("实时Tach信号监控")
-        self.time_ax.grid(True, alpha=0.3)
-        self.time_canvas.draw()
+        self._build_time_lines()
         
         self.printd("已清除tach数据")
         
-        self.update_plots()
+        self._schedule_update()
+    
+    def _new_filtered_buffer(self):
+        """预分配单个风机的滤波结果缓冲区，有效数据为前n个点"""
+        return {
+            't': np.empty(self.FILTER_HISTORY, dtype=np.float64),
+            'y': np.empty(self.FILTER_HISTORY, dtype=np.float32),
+            'n': 0
+        }
+    
+    @staticmethod
+    def _coeff_key(config):
+        """决定滤波器系数（及频率响应图）的配置项"""
+        return (config['filter_method'], config['filter_type'], int(config['order']),
+                float(config['sampling_rate']), float(config['cutoff_frequency']))
+    
+    def _get_coefficients(self, config):
+        """返回滤波器系数，相同配置只设计一次（最近使用的COEFF_CACHE_SIZE个）"""
+        key = self._coeff_key(config)
+        try:
+            self._coeff_cache.move_to_end(key)
+            return self._coeff_cache[key]
+        except KeyError:
+            coefficients = self.design_filter(config)
+            if coefficients is not None:
+                self._coeff_cache[key] = coefficients
+                if len(self._coeff_cache) > self.COEFF_CACHE_SIZE:
+                    self._coeff_cache.popitem(last=False)
+            return coefficients
     
     def design_filter(self, config):
-        """设计滤波器"""
+        """
+        设计滤波器：IIR返回二阶节形式的sos数组 (n_sections, 6)，
+        FIR返回一维抽头数组，失败时返回None
+        """
         try:
             # 检查scipy是否可用
-            if not SCIPY_AVAILABLE or signal is None:
-                return None, None
+            if not _import_scipy():
+                return None
                 
             filter_type = config['filter_type']
             filter_method = config['filter_method']
@@ -797,7 +1147,7 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
             
             # 参数验证
             if fs <= 0 or fc <= 0 or order <= 0:
-                return None, None
+                return None
                 
             # 归一化截止频率
             nyquist = fs / 2
@@ -814,64 +1164,19 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
             # 限制阶数以避免数值问题
             order = min(order, 10)
             
-            # 根据滤波器类型和方法设计滤波器
-            if filter_method in ['BUTTERWORTH', 'IIR']:
-                if filter_type == 'LOWPASS':
-                    b, a = signal.butter(order, normalized_fc, btype='low')
-                elif filter_type == 'HIGHPASS':
-                    b, a = signal.butter(order, normalized_fc, btype='high')
-                elif filter_type == 'BANDPASS':
-                    # 对于带通滤波器，需要两个截止频率
-                    fc_low = max(0.01, normalized_fc - 0.1)
-                    fc_high = min(0.99, normalized_fc + 0.1)
-                    if fc_low >= fc_high:
-                        fc_low = normalized_fc * 0.8
-                        fc_high = normalized_fc * 1.2
-                    b, a = signal.butter(order, [fc_low, fc_high], btype='band')
-                elif filter_type == 'BANDSTOP':
-                    fc_low = max(0.01, normalized_fc - 0.1)
-                    fc_high = min(0.99, normalized_fc + 0.1)
-                    if fc_low >= fc_high:
-                        fc_low = normalized_fc * 0.8
-                        fc_high = normalized_fc * 1.2
-                    b, a = signal.butter(order, [fc_low, fc_high], btype='bandstop')
-                else:
-                    # 默认低通
-                    b, a = signal.butter(order, normalized_fc, btype='low')
-                    
-            elif filter_method == 'CHEBYSHEV1':
-                ripple = 1.0  # 1dB ripple
-                if filter_type == 'LOWPASS':
-                    b, a = signal.cheby1(order, ripple, normalized_fc, btype='low')
-                elif filter_type == 'HIGHPASS':
-                    b, a = signal.cheby1(order, ripple, normalized_fc, btype='high')
-                else:
-                    b, a = signal.cheby1(order, ripple, normalized_fc, btype='low')
-                    
-            elif filter_method == 'FIR':
-                # FIR滤波器设计，限制长度以提高性能
-                fir_length = min(order + 1, 101)  # 限制FIR长度
-                if filter_type == 'LOWPASS':
-                    b = signal.firwin(fir_length, normalized_fc, window='hamming')
-                elif filter_type == 'HIGHPASS':
-                    b = signal.firwin(fir_length, normalized_fc, window='hamming', pass_zero=False)
-                else:
-                    b = signal.firwin(fir_length, normalized_fc, window='hamming')
-                a = [1.0]  # FIR滤波器的分母系数
-                
-            else:
-                # 默认Butterworth低通滤波器
-                b, a = signal.butter(order, normalized_fc, btype='low')
-                
-            return b, a
+            # 根据滤波器方法和类型查表设计，未列出的类型退回该方法的低通
+            design = self._DESIGN.get((filter_method, filter_type)) \
+                or self._DESIGN.get((filter_method, 'LOWPASS')) \
+                or self._DESIGN[('BUTTERWORTH', 'LOWPASS')]
+            return design(order, normalized_fc)
             
         except ImportError:
             # scipy不可用
-            return None, None
+            return None
         except Exception as e:
             if hasattr(self, 'printd'):
                 self.printd(f"滤波器设计错误: {e}")
-            return None, None
+            return None
     
     def safe_update_plots(self):
         """安全的图形更新，用于延迟初始化"""
@@ -898,6 +1203,71 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
             # 静默失败，不影响程序启动
             pass
     
+    def _get_freq_grid(self, fs, points):
+        """返回从fs/2000到奈奎斯特频率的points个对数频率点，采样率与点数不变时复用"""
+        if self._freq_grid[0] != (fs, points):
+            self._freq_grid = ((fs, points), np.logspace(np.log10(fs / 2000), np.log10(fs / 2), points))
+        return self._freq_grid[1]
+    
+    def _build_freq_axes(self, fs, title):
+        """绘制频率响应图的静态部分，并创建动画的幅度曲线、截止频率线及其标注"""
+        ax = self.freq_ax
+        ax.clear()
+        ax.set_xscale('log')
+        
+        self._mag_line, = ax.plot([], [], 'b-', linewidth=2, animated=True)
+        self._cutoff_line = ax.axvline(fs / 4, color='r', linestyle='--', alpha=0.7,
+                                       label='截止频率', animated=True)
+        self._cutoff_text = ax.text(0.98, 0.97, '', transform=ax.transAxes, color='r',
+                                    ha='right', va='top', animated=True)
+        
+        # 添加-3dB线
+        ax.axhline(-3, color='g', linestyle=':', alpha=0.7, label='-3dB')
+        
+        ax.set_xlabel('频率 (Hz)')
+        ax.set_ylabel('幅度 (dB)')
+        ax.set_title(title)
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='lower left')
+        
+        # 设置合理的y轴范围
+        ax.set_ylim([-60, 5])
+        
+        # 设置x轴范围
+        ax.set_xlim([fs / 2000, fs / 2])
+        
+        self._freq_scaffold = (fs, title)
+        self._freq_bg = None
+    
+    def _on_freq_draw(self, event):
+        """完整重绘后截取静态背景，并把动画对象画回去"""
+        if self._mag_line is None:
+            self._freq_bg = None
+            return
+        self._freq_bg = self.freq_canvas.copy_from_bbox(self.freq_ax.bbox)
+        self._draw_freq_artists()
+    
+    def _draw_freq_artists(self):
+        with matplotlib.rc_context(_PATH_RC):
+            for artist in (self._mag_line, self._cutoff_line, self._cutoff_text):
+                self.freq_ax.draw_artist(artist)
+    
+    def _unbind_freq_map(self):
+        """只移除本控件绑定在顶层窗口上的 <Map> 处理函数，保留其他绑定"""
+        top, funcid = self._map_toplevel, self._map_funcid
+        self._map_funcid = None
+        # Python 3.13之前 unbind(sequence, funcid) 会清掉该事件的全部绑定，
+        # 因此从绑定脚本中只删去调用本函数的那一行
+        script = top.bind('<Map>')
+        top.bind('<Map>', '\n'.join(line for line in script.split('\n') if funcid not in line))
+        top.deletecommand(funcid)
+    
+    def _on_freq_visible(self, event=None):
+        """频率响应图重新可见时执行被推迟的更新"""
+        if self._freq_pending:
+            # 等映射完成后再检查可见性
+            self.after_idle(self.safe_update_plots)
+    
     def update_plots(self, *args):
         """更新图形显示"""
         try:
@@ -907,40 +1277,61 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
                 
             config = self.get_current_config()
             
+            # 配置未变化时已绘制的频率响应仍然有效
+            key = self._coeff_key(config)
+            if key == self._freq_key:
+                return
+            
+            # 图不可见（标签页隐藏或窗口最小化）时推迟到重新可见再计算
+            if not self.freq_canvas.get_tk_widget().winfo_viewable():
+                self._freq_pending = True
+                return
+            self._freq_pending = False
+            
             # 设计滤波器
-            b, a = self.design_filter(config)
+            coefficients = self._get_coefficients(config)
             
-            if b is not None and a is not None:
+            if coefficients is not None:
                 # 计算频率响应
-                w, h = signal.freqz(b, a, worN=1024, fs=config['sampling_rate'])  # 减少计算量
-                
-                # 更新频率响应图
-                self.freq_ax.clear()
-                
-                # 幅度响应（dB）
-                magnitude_db = 20 * np.log10(np.abs(h) + 1e-10)
-                self.freq_ax.plot(w, magnitude_db, 'b-', linewidth=2)
-                
-                # 添加截止频率线
-                self.freq_ax.axvline(config['cutoff_frequency'], color='r', 
-                                   linestyle='--', alpha=0.7, label=f"fc = {config['cutoff_frequency']:.1f} Hz")
+                fs = config['sampling_rate']
+                fc = config['cutoff_frequency']
+                points = max(256, min(1024, int(self.freq_ax.bbox.width * 2)))
+                grid = self._get_freq_grid(fs, points)
+                if coefficients.ndim == 2:
+                    w, h = signal.sosfreqz(coefficients, worN=grid, fs=fs)
+                else:
+                    w, h = signal.freqz(coefficients, _FIR_DEN, worN=grid, fs=fs)
                 
-                # 添加-3dB线
-                self.freq_ax.axhline(-3, color='g', linestyle=':', alpha=0.7, label='-3dB')
+                # 幅度响应（dB），由功率计算以省去np.abs中的开方
+                # set_data会复制数据，因此两个缓冲区可以在每次更新中复用
+                if self._mag_db.size != h.size:
+                    self._mag_db = np.empty(h.size)
+                    self._mag_tmp = np.empty(h.size)
+                magnitude_db = self._mag_db
+                np.multiply(h.real, h.real, out=magnitude_db)
+                np.multiply(h.imag, h.imag, out=self._mag_tmp)
+                magnitude_db += self._mag_tmp
+                np.maximum(magnitude_db, 1e-24, out=magnitude_db)
+                np.log10(magnitude_db, out=magnitude_db)
+                magnitude_db *= 10
                 
-                self.freq_ax.set_xlabel('频率 (Hz)')
-                self.freq_ax.set_ylabel('幅度 (dB)')
-                self.freq_ax.set_title(f'{config["filter_type"]} {config["filter_method"]} 滤波器频率响应')
-                self.freq_ax.grid(True, alpha=0.3)
-                self.freq_ax.legend()
+                # 采样率或标题变化时重建静态部分并完整重绘，否则只blit动画对象
+                title = f'{config["filter_type"]} {config["filter_method"]} 滤波器频率响应'
+                redraw = self._freq_scaffold != (fs, title) or self._freq_bg is None
+                if self._freq_scaffold != (fs, title):
+                    self._build_freq_axes(fs, title)
                 
-                # 设置合理的y轴范围
-                self.freq_ax.set_ylim([-60, 5])
+                self._mag_line.set_data(w, magnitude_db)
+                self._cutoff_line.set_xdata([fc, fc])
+                self._cutoff_text.set_text(f"fc = {fc:.1f} Hz")
                 
-                # 设置x轴范围
-                self.freq_ax.set_xlim([0, config['sampling_rate'] / 2])
-                
-                self.freq_canvas.draw()
+                if redraw:
+                    self.freq_canvas.draw_idle()
+                else:
+                    self.freq_canvas.restore_region(self._freq_bg)
+                    self._draw_freq_artists()
+                    self.freq_canvas.blit(self.freq_ax.bbox)
+                self._freq_key = key
                 
                 self.status_var.set(f"频率响应已更新 - {config['filter_type']} {config['filter_method']}")
             else:
@@ -950,7 +1341,10 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
                 self.freq_ax.set_ylabel('幅度 (dB)')
                 self.freq_ax.set_title('频率响应 - 等待配置')
                 self.freq_ax.grid(True, alpha=0.3)
-                self.freq_canvas.draw()
+                self._mag_line = None
+                self._freq_scaffold = None
+                self.freq_canvas.draw_idle()
+                self._freq_key = None
                 self.status_var.set("等待滤波器配置")
                 
         except ImportError as e:
@@ -966,10 +1360,12 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
     def apply_filter(self):
         """应用滤波器"""
         try:
+            self._last_seen.clear()
+            self._zi.clear()
             config = self.get_current_config()
             
             # 更新频率响应图
-            self.update_plots()
+            self._schedule_update()
             
             # 应用滤波器到当前数据
             self._apply_current_filter()
@@ -998,6 +1394,9 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         self.huber_window_var.set("10")
         self.alpha_var.set("0.8")
         self.beta_var.set("0.2")
+        self._last_seen.clear()
+        self._zi.clear()
+        self._schedule_update()
         self.status_var.set("配置已重置")
     
     def save_config(self):
@@ -1029,8 +1428,17 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         except Exception as e:
             messagebox.showerror("错误", f"加载配置失败: {e}")
     
+    def _invalidate_config(self, *args):
+        self._config = None
+    
     def get_current_config(self):
-        """获取当前配置"""
+        """获取当前配置（参数变量未改变时返回缓存，避免每次更新都读取Tk变量）"""
+        if self._config is None:
+            self._config = self._read_config()
+        return self._config
+    
+    def _read_config(self):
+        """从Tk变量读取并校验配置"""
         try:
             config = {
                 'filter_type': self.filter_type_var.get(),
@@ -1090,6 +1498,13 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
             except (tk.TclError, AttributeError, RuntimeError):
                 pass
             
+            # Remove the <Map> handler bound on the toplevel window
+            if getattr(self, '_map_funcid', None):
+                try:
+                    self._unbind_freq_map()
+                except (tk.TclError, AttributeError, RuntimeError):
+                    pass
+            
             # Clean up matplotlib canvases
             if hasattr(self, 'freq_canvas') and self.freq_canvas:
                 try:
@@ -1145,4 +1560,5 @@ class FilterConfigWidget(ttk.Frame, pt.PrintClient):
         self.beta_var.set(str(config.get('beta_factor', 0.2)))
         
         # 更新参数显示
-        self.on_filter_method_change()
\ No newline at end of file
+        self.on_filter_method_change()
+        self._schedule_update()
\ No newline at end of file
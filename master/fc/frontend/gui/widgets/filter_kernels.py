@@ -0,0 +1,182 @@
+################################################################################
+## Project: Fanclub Mark IV "Master" Filter Kernels                         ##
+##----------------------------------------------------------------------------##
+## WESTLAKE UNIVERSITY ## ADVANCED SYSTEMS LABORATORY ##                     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## zhaoyang                   ## <mzymuzhaoyang@gmail.com> ##                 ##
+## dashuai                    ## <dschen2018@gmail.com>    ##                 ##
+##                            ##                           ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Per-sample filter kernels used by the filter configuration widget.
+ + Compiled with numba when available, pure Python/numpy otherwise.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import numpy as np
+
+# 尝试导入numba，用于编译递推滤波内核；不可用时退回纯Python实现
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+## KERNELS #####################################################################
+# 递推内核把结果写入调用方预分配的y（与x同形）并返回y；
+# 一维为一路信号，二维时每行为一个风机，各行独立滤波
+
+def _huber_row(x, y, threshold, window):
+    """Huber鲁棒滤波：对滑动窗口内围绕中位数的残差做Huber加权平均"""
+    n = x.shape[0]
+    for i in range(n):
+        lo = max(0, i - window + 1)
+        if lo == i:
+            y[i] = x[i]
+            continue
+        samples = x[lo:i + 1]
+        med = np.median(samples)
+        weighted_sum = 0.0
+        weight_sum = 0.0
+        for v in samples:
+            r = abs(v - med)
+            w = 1.0 if r <= threshold else threshold / r
+            weighted_sum += w * v
+            weight_sum += w
+        y[i] = weighted_sum / weight_sum if weight_sum > 0 else med
+    return y
+
+def _alpha_beta_row(x, y, alpha, beta, dt):
+    """α-β滤波：以第一个样本初始化位置，速度初始为0"""
+    n = x.shape[0]
+    position = x[0]
+    velocity = 0.0
+    y[0] = position
+    for i in range(1, n):
+        predicted = position + velocity * dt
+        residual = x[i] - predicted
+        position = predicted + alpha * residual
+        velocity = velocity + (beta * residual) / dt
+        y[i] = position
+    return y
+
+def _kalman_row(x, y, process_noise, observation_noise):
+    """一维卡尔曼滤波：以第一个样本作为初始估计，初始误差方差为1"""
+    n = x.shape[0]
+    estimate = x[0]
+    error = 1.0
+    y[0] = estimate
+    for i in range(1, n):
+        error_pred = error + process_noise
+        gain = error_pred / (error_pred + observation_noise)
+        estimate = estimate + gain * (x[i] - estimate)
+        error = (1.0 - gain) * error_pred
+        y[i] = estimate
+    return y
+
+def huber_filter(x, y, threshold, window):
+    for row_x, row_y in zip(np.atleast_2d(x), np.atleast_2d(y)):
+        _huber_row(row_x, row_y, threshold, window)
+    return y
+
+def alpha_beta(x, y, alpha, beta, dt):
+    for row_x, row_y in zip(np.atleast_2d(x), np.atleast_2d(y)):
+        _alpha_beta_row(row_x, row_y, alpha, beta, dt)
+    return y
+
+def kalman(x, y, process_noise, observation_noise):
+    for row_x, row_y in zip(np.atleast_2d(x), np.atleast_2d(y)):
+        _kalman_row(row_x, row_y, process_noise, observation_noise)
+    return y
+
+def moving_average(x, window):
+    """沿最后一维的滑动平均（累加和实现），前window个点按已有点数平均"""
+    csum = np.cumsum(x, axis=-1)
+    filtered = np.empty_like(csum)
+    filtered[..., :window] = csum[..., :window] / np.arange(1, window + 1)
+    filtered[..., window:] = (csum[..., window:] - csum[..., :-window]) / window
+    return filtered
+
+if NUMBA_AVAILABLE:
+    # nogil：编译后的内核运行时释放GIL，可在工作线程中并发处理多个风机
+    _jit = njit(cache=True, fastmath=True, nogil=True)
+    _huber_row = _jit(_huber_row)
+    _alpha_beta_row = _jit(_alpha_beta_row)
+    _kalman_row = _jit(_kalman_row)
+
+    # 多个风机时按行并行（prange），各行互不依赖
+    @njit(parallel=True, cache=True, nogil=True)
+    def _huber_batch(x, y, threshold, window):
+        for i in prange(x.shape[0]):
+            _huber_row(x[i], y[i], threshold, window)
+        return y
+
+    @njit(parallel=True, cache=True, nogil=True)
+    def _alpha_beta_batch(x, y, alpha, beta, dt):
+        for i in prange(x.shape[0]):
+            _alpha_beta_row(x[i], y[i], alpha, beta, dt)
+        return y
+
+    @njit(parallel=True, cache=True, nogil=True)
+    def _kalman_batch(x, y, process_noise, observation_noise):
+        for i in prange(x.shape[0]):
+            _kalman_row(x[i], y[i], process_noise, observation_noise)
+        return y
+
+    def huber_filter(x, y, threshold, window):
+        if x.ndim == 2:
+            return _huber_batch(x, y, threshold, window)
+        return _huber_row(x, y, threshold, window)
+
+    def alpha_beta(x, y, alpha, beta, dt):
+        if x.ndim == 2:
+            return _alpha_beta_batch(x, y, alpha, beta, dt)
+        return _alpha_beta_row(x, y, alpha, beta, dt)
+
+    def kalman(x, y, process_noise, observation_noise):
+        if x.ndim == 2:
+            return _kalman_batch(x, y, process_noise, observation_noise)
+        return _kalman_row(x, y, process_noise, observation_noise)
+
+    @njit(parallel=True, cache=True, nogil=True)
+    def _moving_average_batch(x, window):
+        """二维输入按行（每行一个风机）并行计算滑动平均"""
+        filtered = np.empty_like(x)
+        for i in prange(x.shape[0]):
+            acc = 0.0
+            for j in range(x.shape[1]):
+                acc += x[i, j]
+                if j >= window:
+                    acc -= x[i, j - window]
+                filtered[i, j] = acc / min(j + 1, window)
+        return filtered
+
+    def moving_average(x, window, _numpy=moving_average):
+        if x.ndim == 2:
+            return _moving_average_batch(x, window)
+        return _numpy(x, window)
+
+    # 导入时预编译（cache=True时从磁盘缓存加载），避免首次滤波时在GUI回调中等待JIT
+    _warmup = np.zeros((1, 4))
+    for _x in (_warmup[0], _warmup):
+        huber_filter(_x, np.empty_like(_x), 1.345, 2)
+        alpha_beta(_x, np.empty_like(_x), 0.8, 0.2, 0.001)
+        kalman(_x, np.empty_like(_x), 0.01, 0.1)
+    _moving_average_batch(_warmup, 2)
+    del _x
+    del _warmup
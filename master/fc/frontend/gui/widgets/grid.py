@@ -380,6 +380,22 @@ class BaseGrid(ttk.Frame):
                 # Canvas or widget has been destroyed, ignore the update
                 pass
 
+    def configi(self, i, fill, outline, width):
+        """
+        Set the cell at 'index' I to color FILL and its border to color OUTLINE
+        and width WIDTH in a single canvas operation.
+        """
+        if self.canvas and self.winfo_exists():
+            try:
+                self.fills[i] = fill
+                self.outlines[i] = outline
+                self.widths[i] = width
+                self.canvas.itemconfig(
+                    self.iids[i], fill = fill, outline = outline, width = width)
+            except tk.TclError:
+                # Canvas or widget has been destroyed, ignore the update
+                pass
+
     def outlinec(self, r, c, outline, width):
         """
         Set the border of the cell at row R and column Cto color OUTLINE and
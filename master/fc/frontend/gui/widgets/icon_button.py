@@ -35,6 +35,7 @@ from PIL import Image, ImageDraw, ImageFont, ImageTk
 import base64
 import xml.etree.ElementTree as ET
 import re
+import weakref
 
 from fc.frontend.gui.embedded.icons import get_icon, get_icon_with_color
 from fc.frontend.gui.theme_manager import theme_manager
@@ -80,6 +81,31 @@ def create_simple_icon(icon_name, size=(16, 16), color="#000000"):
     
     return img
 
+def _icon_cache_key(icon_name, color):
+    return f"{icon_name}_{color}_{16}_{16}"
+
+def cache_theme_icons(icon_name):
+    """
+    Create the icon in the text color of every theme and store each
+    PhotoImage in the shared icon cache, so that switching themes later
+    only looks icons up. Requires a Tk root.
+    """
+    icon_cache = get_performance_manager().icon_cache
+    colors = {theme.get('TEXT_PRIMARY', '#000000') for theme in theme_manager.themes.values()}
+    for color in colors:
+        cache_key = _icon_cache_key(icon_name, color)
+        if icon_cache.get_icon(cache_key) is None:
+            icon_img = create_simple_icon(icon_name, size=(16, 16), color=color)
+            icon_cache.cache_icon(cache_key, ImageTk.PhotoImage(icon_img))
+
+def _update_all_icons():
+    """
+    Single theme callback shared by all IconButtons: update the icon of
+    every live button instead of registering one callback per button.
+    """
+    for button in list(IconButton._instances):
+        button._on_theme_change()
+
 class IconButton(ttk.Frame):
     """
     A button widget that displays an icon alongside text.
@@ -92,6 +118,9 @@ class IconButton(ttk.Frame):
     - Multiple button styles (primary, secondary, etc.)
     """
     
+    # Live buttons, updated together by _update_all_icons on theme changes
+    _instances = weakref.WeakSet()
+    
     def __init__(self, master, text="", icon=None, command=None, style="Secondary", **kwargs):
         super().__init__(master, **kwargs)
         
@@ -100,6 +129,7 @@ class IconButton(ttk.Frame):
         self.command = command
         self.style_name = style
         self.icon_image = None
+        self._icon_key = None  # Icon cache key self.icon_image was created for
         
         # Create the actual button
         button_style = f"{style}.TButton" if style else "TButton"
@@ -118,8 +148,10 @@ class IconButton(ttk.Frame):
         if icon:
             self._update_icon()
         
-        # Register for theme changes
-        theme_manager.register_callback(self._on_theme_change)
+        # Register for theme changes (one shared callback for all buttons)
+        IconButton._instances.add(self)
+        if _update_all_icons not in theme_manager.callbacks:
+            theme_manager.register_callback(_update_all_icons)
     
     def _update_icon(self):
         """
@@ -133,22 +165,23 @@ class IconButton(ttk.Frame):
             # Get current theme color
             color = theme_manager.get_color('TEXT_PRIMARY')
             
-            # Try to get cached icon first
-            performance_manager = get_performance_manager()
-            cache_key = f"{self.icon_name}_{color}_{16}_{16}"
-            cached_icon = performance_manager.icon_cache.get_icon(cache_key)
-            
-            if cached_icon:
+            # Keep the current image if it was drawn for this icon and color
+            cache_key = _icon_cache_key(self.icon_name, color)
+            if self.icon_image is None or self._icon_key != cache_key:
+                # Icons are shared by all buttons; on a miss, create this
+                # icon for every theme at once so theme switches hit the cache
+                icon_cache = get_performance_manager().icon_cache
+                cached_icon = icon_cache.get_icon(cache_key)
+                if cached_icon is None:
+                    cache_theme_icons(self.icon_name)
+                    cached_icon = icon_cache.get_icon(cache_key)
+                if cached_icon is None:
+                    # Color not in any theme (e.g. overridden at runtime)
+                    cached_icon = ImageTk.PhotoImage(
+                        create_simple_icon(self.icon_name, size=(16, 16), color=color))
+                    icon_cache.cache_icon(cache_key, cached_icon)
                 self.icon_image = cached_icon
-            else:
-                # Create simple icon
-                icon_img = create_simple_icon(self.icon_name, size=(16, 16), color=color)
-                
-                # Convert to PhotoImage
-                self.icon_image = ImageTk.PhotoImage(icon_img)
-                
-                # Cache the icon for future use
-                performance_manager.icon_cache.cache_icon(cache_key, self.icon_image)
+                self._icon_key = cache_key
             
             # Update button with icon and text
             if self.text:
@@ -162,15 +195,8 @@ class IconButton(ttk.Frame):
             self.button.config(image="", text=self.text or "")
     
     def destroy(self):
-        """Override destroy method to clean up theme callbacks"""
-        try:
-            # Unregister theme callback to prevent errors during shutdown
-            from fc.frontend.gui.theme_manager import theme_manager
-            if hasattr(self, '_on_theme_change'):
-                theme_manager.unregister_callback(self._on_theme_change)
-                print("[DEBUG] Theme callback unregistered for icon button")
-        except Exception as e:
-            print(f"[DEBUG] Error unregistering theme callback: {e}")
+        """Override destroy method to stop theme updates for this button"""
+        IconButton._instances.discard(self)
         
         # Call parent destroy
         try:
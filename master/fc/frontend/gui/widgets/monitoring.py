@@ -35,7 +35,6 @@ import queue
 import math
 import numpy as np
 from datetime import datetime
-from collections import deque
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 import sys
@@ -72,6 +71,7 @@ CHANNEL_COLORS = ['#2196F3', '#4CAF50', '#FF9800', '#F44336', '#9C27B0', '#00BCD
 TACH_COLORS = ['#E91E63', '#9C27B0', '#673AB7', '#3F51B5', '#2196F3', '#00BCD4']
 MAX_TACH_FANS = 29  # Maximum number of fans
 TACH_FILTER_WINDOW = 10  # Filter window size
+TACH_BAR_REDRAW_RPM = 50.0  # RPM change that redraws the speed distribution bars
 
 ## TACH DATA STRUCTURES ##########################################################
 @dataclass
@@ -97,6 +97,211 @@ class TachSignalConfig:
     enable_simulation: bool = False  # Enable/disable simulated data generation
     simulation_diagnostics: bool = False  # Enable/disable diagnostics for simulated data
 
+class SeriesBuffer:
+    """
+    Bounded history of several series, stored as one float64 row per field.
+    Samples are appended into a block twice the capacity wide; when it fills,
+    the newest samples are moved back to the front, so each series is always
+    available as a contiguous, chronological view (data['timestamps'], ...).
+    Views are invalidated by later appends; copy them to keep them.
+    """
+    FIELDS = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._ROWS = {name: row for row, name in enumerate(cls.FIELDS)}
+    
+    def __init__(self, capacity=MAX_DATA_POINTS):
+        self.capacity = capacity
+        self._block = np.empty((len(self.FIELDS), 2*capacity), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+    
+    def append(self, *values):
+        """Store one sample of every series (in FIELDS order), dropping the oldest when full"""
+        if self._end == self._block.shape[1]:
+            keep = self.capacity - 1
+            self._block[:, :keep] = self._block[:, self._end - keep:self._end]
+            self._start, self._end = 0, keep
+        self._block[:, self._end] = values
+        self._end += 1
+        self._start = max(self._start, self._end - self.capacity)
+    
+    def clear(self):
+        self._start = self._end = 0
+    
+    def get(self, name, default=None):
+        if name in self._ROWS:
+            return self[name]
+        return default
+    
+    def __getitem__(self, name):
+        return self._block[self._ROWS[name], self._start:self._end]
+    
+    def __len__(self):
+        return self._end - self._start
+
+class TachBuffer(SeriesBuffer):
+    """Bounded tach history for one fan"""
+    FIELDS = ('timestamps', 'rpm_values', 'filtered_rpm', 'duty_cycles', 'timeouts', 'raw_signals')
+    
+    def append(self, timestamp, rpm, filtered_rpm, duty_cycle, timeout, raw_signal):
+        super().append(timestamp, rpm, filtered_rpm, duty_cycle, timeout,
+            np.nan if raw_signal is None else raw_signal)
+
+class SignalBuffer(SeriesBuffer):
+    """Bounded history of one acquisition channel"""
+    FIELDS = ('timestamps', 'values')
+
+class SystemStatsBuffer(SeriesBuffer):
+    """Bounded history of the system performance metrics"""
+    FIELDS = ('timestamps', 'cpu_usage', 'memory_usage', 'network_packets')
+
+class TachFilterBank:
+    """
+    Moving-average and low-pass filter state for all fans, updated for a
+    batch of fans at once. The moving average keeps, per fan, a circular
+    window of the last samples and its running sum, so each sample costs
+    O(1) regardless of the window size; until a window fills up, the
+    average is over the samples seen so far.
+    """
+    ALPHA = 0.1  # Low-pass smoothing factor
+    
+    def __init__(self, fans=MAX_TACH_FANS, window=TACH_FILTER_WINDOW):
+        self.window = window
+        self._samples = np.zeros((fans, window))
+        self._sums = np.zeros(fans)
+        self._heads = np.zeros(fans, dtype=np.intp)
+        self._counts = np.zeros(fans, dtype=np.intp)
+        self._last = np.zeros(fans)
+        self._primed = np.zeros(fans, dtype=bool)  # Low-pass has an output
+    
+    def moving_average(self, fan_ids, values):
+        """Add one sample per fan in fan_ids and return their moving averages"""
+        fan_ids = self._rows(fan_ids)
+        values = np.asarray(values, dtype=np.float64)
+        heads = self._heads[fan_ids]
+        # Slots not yet written hold 0, so the sum update needs no mask
+        self._sums[fan_ids] += values - self._samples[fan_ids, heads]
+        self._samples[fan_ids, heads] = values
+        heads += 1
+        heads[heads == self.window] = 0
+        self._heads[fan_ids] = heads
+        self._counts[fan_ids] = np.minimum(self._counts[fan_ids] + 1, self.window)
+        # Recompute the sums once per window pass so rounding cannot accumulate
+        wrapped = fan_ids[heads == 0]
+        if len(wrapped):
+            self._sums[wrapped] = self._samples[wrapped].sum(axis=1)
+        return self._sums[fan_ids] / self._counts[fan_ids]
+    
+    def low_pass(self, fan_ids, values):
+        """Add one sample per fan in fan_ids and return their low-pass outputs"""
+        fan_ids = self._rows(fan_ids)
+        values = np.asarray(values, dtype=np.float64)
+        filtered = np.where(self._primed[fan_ids],
+            self.ALPHA * values + (1 - self.ALPHA) * self._last[fan_ids], values)
+        self._last[fan_ids] = filtered
+        self._primed[fan_ids] = True
+        return filtered
+    
+    def set_window(self, window):
+        """Change the moving-average window, keeping each fan's newest samples"""
+        fans = len(self._sums)
+        samples = np.zeros((fans, window))
+        for fan_id in range(fans):
+            count = self._counts[fan_id]
+            # Chronological order: the oldest sample sits at the head once full
+            order = (self._heads[fan_id] - count + np.arange(count)) % self.window
+            kept = self._samples[fan_id, order][-window:]
+            samples[fan_id, :len(kept)] = kept
+            self._counts[fan_id] = len(kept)
+        self.window = window
+        self._samples = samples
+        self._heads = self._counts % window
+        self._sums = samples.sum(axis=1)
+    
+    def _rows(self, fan_ids):
+        """Fan IDs as an index array, growing the state for unseen fans"""
+        fan_ids = np.asarray(fan_ids, dtype=np.intp)
+        extra = int(fan_ids.max(initial=-1)) + 1 - len(self._sums)
+        if extra > 0:
+            self._samples = np.vstack((self._samples, np.zeros((extra, self.window))))
+            self._sums = np.concatenate((self._sums, np.zeros(extra)))
+            self._heads = np.concatenate((self._heads, np.zeros(extra, dtype=np.intp)))
+            self._counts = np.concatenate((self._counts, np.zeros(extra, dtype=np.intp)))
+            self._last = np.concatenate((self._last, np.zeros(extra)))
+            self._primed = np.concatenate((self._primed, np.zeros(extra, dtype=bool)))
+        return fan_ids
+
+## PLOT HELPERS ################################################################
+class BlitManager:
+    """
+    Redraw the animated artists of a canvas over a cached background.
+
+    Every full draw (first show, resize, limit change) fires the canvas
+    draw_event, which recaptures each axes background and paints the
+    artists on top. Between full draws, update() only restores the cached
+    backgrounds, draws the artists and blits the axes regions.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._axes = []
+        self._backgrounds = None
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def add(self, ax, artists):
+        """Register an axes and the (mutable) list of its animated artists"""
+        self._axes.append((ax, artists))
+
+    def invalidate(self):
+        """Request a full redraw; blits wait until it recaptures the backgrounds"""
+        self._backgrounds = None
+        self.canvas.draw_idle()
+
+    def update(self):
+        """Blit the animated artists, or fall back to a full draw"""
+        if self._backgrounds is None:
+            self.canvas.draw_idle()
+            return
+        for background in self._backgrounds:
+            self.canvas.restore_region(background)
+        self._draw_artists()
+        for ax, _ in self._axes:
+            self.canvas.blit(ax.bbox)
+
+    def _on_draw(self, event):
+        """Capture the static backgrounds after a full draw"""
+        self._backgrounds = [self.canvas.copy_from_bbox(ax.bbox) for ax, _ in self._axes]
+        self._draw_artists()
+
+    def _draw_artists(self):
+        """Draw every registered animated artist into its axes"""
+        for ax, artists in self._axes:
+            for artist in artists:
+                ax.draw_artist(artist)
+
+def fit_limits(ax, x_min, x_max, y_min=None, y_max=None, y_pad=0.0):
+    """
+    Keep the axes limits while the data stays inside them, otherwise refit
+    with headroom on the time axis so the following samples still fit.
+    Returns True when the limits changed and the background must be redrawn.
+    """
+    x_low, x_high = ax.get_xlim()
+    fits = x_low <= x_min and x_max <= x_high
+    if y_min is not None:
+        y_low, y_high = ax.get_ylim()
+        fits = fits and y_low <= y_min and y_max <= y_high
+    if fits:
+        return False
+
+    # Ensure minimum range for xlims to avoid singular transformation
+    span = max(x_max - x_min, 0.1)
+    ax.set_xlim(x_min, x_min + span * 1.25)
+    if y_min is not None:
+        ax.set_ylim(y_min - y_pad, y_max + y_pad)
+    return True
+
 ################################################################################
 class MonitoringWidget(ttk.Frame, pt.PrintClient):
     """Main data monitoring and visualization component"""
@@ -120,12 +325,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         
         # Data storage
         self.signal_data = {}
-        self.system_stats = {
-            'cpu_usage': deque(maxlen=MAX_DATA_POINTS),
-            'memory_usage': deque(maxlen=MAX_DATA_POINTS),
-            'network_packets': deque(maxlen=MAX_DATA_POINTS),
-            'timestamps': deque(maxlen=MAX_DATA_POINTS)
-        }
+        self.system_stats = SystemStatsBuffer()
         
         # Tach signal data storage
         self.tach_data = {}
@@ -138,8 +338,9 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
             enable_simulation=False,  # Disable simulation by default
             simulation_diagnostics=False  # Disable simulation diagnostics by default
         )
-        self.tach_filters = {}  # Filter states
+        self.tach_filters = TachFilterBank()  # Filter states
         self.fc_communicator = None
+        self._rng = np.random.default_rng()  # Simulated data source
         
         # Monitoring status
         self.monitoring_active = False
@@ -280,7 +481,8 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         self.signal_lines = []
         for i in range(3):  # 3 channels
             line, = self.signal_ax.plot([], [], color=CHANNEL_COLORS[i], 
-                                      label=f'Channel {i+1}', linewidth=2)
+                                      label=f'Channel {i+1}', linewidth=2,
+                                      animated=True)
             self.signal_lines.append(line)
         
         self.signal_ax.legend()
@@ -288,6 +490,8 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         
         # Embed into tkinter
         self.signal_canvas = FigureCanvasTkAgg(self.signal_fig, plot_frame)
+        self.signal_blit = BlitManager(self.signal_canvas)
+        self.signal_blit.add(self.signal_ax, self.signal_lines)
         self.signal_canvas.draw()
         self.signal_canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
     
@@ -408,7 +612,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         self.tach_ax_raw.set_facecolor(SURFACE_2)
         self.tach_ax_raw.set_title('Raw Tach Signal Monitoring', color=TEXT_PRIMARY, fontsize=12)
         self.tach_ax_raw.set_xlabel('Time (s)', color=TEXT_PRIMARY)
-        self.tach_ax_raw.set_ylabel('Signal Amplitude', color=TEXT_PRIMARY)
+        self.tach_ax_raw.set_ylabel('Signal Amplitude (V)', color=TEXT_PRIMARY)
         self.tach_ax_raw.tick_params(colors=TEXT_PRIMARY)
         self.tach_ax_raw.grid(True, alpha=0.3)
         
@@ -428,12 +632,19 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         self.tach_ax2.tick_params(colors=TEXT_PRIMARY)
         self.tach_ax2.grid(True, alpha=0.3, axis='y')
         
-        # Initialize Tach signal lines
+        # Initialize Tach signal lines (created per fan on first data)
         self.tach_lines = {}
+        self.tach_raw_artists = []
+        self.tach_rpm_artists = []
         self.tach_bars = None
+        self.tach_bar_fans = ()
+        self.tach_bar_rpms = None
         
         # Embed into tkinter
         self.tach_canvas = FigureCanvasTkAgg(self.tach_fig, plot_frame)
+        self.tach_blit = BlitManager(self.tach_canvas)
+        self.tach_blit.add(self.tach_ax_raw, self.tach_raw_artists)
+        self.tach_blit.add(self.tach_ax1, self.tach_rpm_artists)
         self.tach_canvas.draw()
         self.tach_canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
     
@@ -507,8 +718,10 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         self.perf_ax.tick_params(colors=TEXT_PRIMARY)
         
         # Performance metric lines
-        self.cpu_line, = self.perf_ax.plot([], [], color=SUCCESS_MAIN, label='CPU', linewidth=2)
-        self.mem_line, = self.perf_ax.plot([], [], color=WARNING_MAIN, label='Memory', linewidth=2)
+        self.cpu_line, = self.perf_ax.plot([], [], color=SUCCESS_MAIN, label='CPU', linewidth=2,
+                                           animated=True)
+        self.mem_line, = self.perf_ax.plot([], [], color=WARNING_MAIN, label='Memory', linewidth=2,
+                                           animated=True)
         
         self.perf_ax.legend()
         self.perf_ax.grid(True, alpha=0.3)
@@ -516,6 +729,8 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         
         # Embed into tkinter
         self.perf_canvas = FigureCanvasTkAgg(self.perf_fig, plot_frame)
+        self.perf_blit = BlitManager(self.perf_canvas)
+        self.perf_blit.add(self.perf_ax, [self.cpu_line, self.mem_line])
         self.perf_canvas.draw()
         self.perf_canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
     
@@ -632,8 +847,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
     def _clear_data(self):
         """Clear all data"""
         self.signal_data.clear()
-        for key in self.system_stats:
-            self.system_stats[key].clear()
+        self.system_stats.clear()
         
         # Clear text display
         if hasattr(self, 'signal_text'):
@@ -659,14 +873,8 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         #         current_time = time.time() - start_time
         #         
         #         # Get data from signal acquisition engine - batch processing
-        #         all_signal_data = []
-        #         # 批量获取数据，最多获取20批次以提高消费效率
-        #         for _ in range(20):
-        #             signal_data = self.acquisition_engine.get_data(timeout=0.005)
-        #             if signal_data:
-        #                 all_signal_data.extend(signal_data)
-        #             else:
-        #                 break
+        #         # 阻塞等待数据到达，再一次性取空队列（最多等待0.5秒）
+        #         all_signal_data = self.acquisition_engine.get_data_batch(timeout=0.5)
         #         
         #         if all_signal_data:
         #             self._process_signal_data(all_signal_data, current_time)
@@ -678,8 +886,6 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         #         if self.tach_monitoring_active:
         #             self._generate_mock_tach_data(current_time)
         #         
-        #         time.sleep(0.05)  # 50ms update interval - 更频繁的更新以消费更多数据
-        #         
         #     except Exception as e:
         #         self.printd(f"Data update error: {e}")
         #         break
@@ -691,14 +897,10 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
                 channel_key = f'channel_{sample.channel_id}'
                 
                 if channel_key not in self.signal_data:
-                    self.signal_data[channel_key] = {
-                        'timestamps': deque(maxlen=MAX_DATA_POINTS),
-                        'values': deque(maxlen=MAX_DATA_POINTS)
-                    }
+                    self.signal_data[channel_key] = SignalBuffer()
                 
                 # Add real signal data
-                self.signal_data[channel_key]['timestamps'].append(sample.timestamp)
-                self.signal_data[channel_key]['values'].append(sample.value)
+                self.signal_data[channel_key].append(sample.timestamp, sample.value)
                 
         except Exception as e:
             self.printd(f"Signal data processing error: {e}")
@@ -712,15 +914,11 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
                     channel_key = f'channel_{sample.channel_id}'
                     
                     if channel_key not in self.signal_data:
-                        self.signal_data[channel_key] = {
-                            'timestamps': deque(maxlen=MAX_DATA_POINTS),
-                            'values': deque(maxlen=MAX_DATA_POINTS)
-                        }
+                        self.signal_data[channel_key] = SignalBuffer()
                     
                     # Use relative timestamp
                     relative_time = current_time
-                    self.signal_data[channel_key]['timestamps'].append(relative_time)
-                    self.signal_data[channel_key]['values'].append(sample.value)
+                    self.signal_data[channel_key].append(relative_time, sample.value)
                     
         except Exception as e:
             self.printd(f"Signal data processing error: {e}")
@@ -807,11 +1005,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
             if 1 <= window_size <= 50:
                 self.tach_config.filter_window = window_size
                 # Update window size for all filters
-                for fan_id in self.tach_filters:
-                    self.tach_filters[fan_id]['buffer'] = deque(
-                        list(self.tach_filters[fan_id]['buffer'])[-window_size:],
-                        maxlen=window_size
-                    )
+                self.tach_filters.set_window(window_size)
                 self.printd(f"Filter window size changed to: {window_size}")
             else:
                 self.printw("Filter window size must be between 1-50")
@@ -834,46 +1028,29 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
             self.printw("RPM threshold must be a number")
             self.rpm_threshold_var.set(str(self.tach_config.rpm_threshold))
     
-    def _apply_tach_filter(self, fan_id: int, rpm_value: float) -> float:
-        """Apply Tach signal filtering"""
+    def _apply_tach_filter(self, fan_ids, rpm_values):
+        """Apply Tach signal filtering to one reading per fan in fan_ids"""
         if not self.tach_config.filter_enabled or self.tach_config.filter_type == "none":
-            return rpm_value
-        
-        if fan_id not in self.tach_filters:
-            self.tach_filters[fan_id] = {
-                'buffer': deque(maxlen=self.tach_config.filter_window),
-                'alpha': 0.1
-            }
-        
-        filter_state = self.tach_filters[fan_id]
+            return rpm_values
         
         if self.tach_config.filter_type == "moving_average":
             # Moving average filter
-            filter_state['buffer'].append(rpm_value)
-            if len(filter_state['buffer']) > 0:
-                return sum(filter_state['buffer']) / len(filter_state['buffer'])
-            else:
-                return rpm_value
+            return self.tach_filters.moving_average(fan_ids, rpm_values)
         
         elif self.tach_config.filter_type == "low_pass":
             # Simple low-pass filter
-            if 'last_filtered' not in filter_state:
-                filter_state['last_filtered'] = rpm_value
-            
-            alpha = filter_state['alpha']
-            filtered_value = alpha * rpm_value + (1 - alpha) * filter_state['last_filtered']
-            filter_state['last_filtered'] = filtered_value
-            return filtered_value
+            return self.tach_filters.low_pass(fan_ids, rpm_values)
         
-        return rpm_value
+        return rpm_values
     
-    def _diagnose_tach_signal(self, fan_id: int, reading: TachReading, filtered_rpm: float):
+    def _diagnose_tach_signal(self, fan_id: int, timeout: bool, duty_cycle: float,
+                             filtered_rpm: float):
         """Diagnose Tach signal anomalies"""
         try:
             # Skip diagnostics for simulated data to reduce log spam
             if not hasattr(self, 'fc_communicator') or self.fc_communicator is None:
                 # Only log critical issues for simulated data with reduced frequency
-                if reading.timeout and self.tach_config.simulation_diagnostics:
+                if timeout and self.tach_config.simulation_diagnostics:
                     # Reduce timeout logging frequency
                     if not hasattr(self, '_last_timeout_log'):
                         self._last_timeout_log = {}
@@ -890,13 +1067,13 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
             current_time = time.time()
             
             # Timeout detection
-            if reading.timeout:
+            if timeout:
                 if fan_id not in self._last_diagnostic_log or current_time - self._last_diagnostic_log[fan_id] > 10:
                     self.printw(f"Fan {fan_id+1} Tach signal timeout")
                     self._last_diagnostic_log[fan_id] = current_time
             
             # RPM anomaly detection
-            if not reading.timeout:
+            if not timeout:
                 # Check if RPM is too low
                 if filtered_rpm < self.tach_config.rpm_threshold:
                     if fan_id not in self._last_diagnostic_log or current_time - self._last_diagnostic_log[fan_id] > 15:
@@ -911,7 +1088,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
                 
                 # Check if RPM fluctuation is too large
                 if fan_id in self.tach_data and len(self.tach_data[fan_id]['filtered_rpm']) > 5:
-                    recent_rpms = list(self.tach_data[fan_id]['filtered_rpm'])[-5:]
+                    recent_rpms = self.tach_data[fan_id]['filtered_rpm'][-5:]
                     rpm_std = np.std(recent_rpms) if len(recent_rpms) > 1 else 0
                     if rpm_std > 200:  # RPM standard deviation too large
                         if fan_id not in self._last_diagnostic_log or current_time - self._last_diagnostic_log[fan_id] > 20:
@@ -919,43 +1096,46 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
                             self._last_diagnostic_log[fan_id] = current_time
             
             # Duty cycle anomaly detection
-            if reading.duty_cycle < 0 or reading.duty_cycle > 1:
+            if duty_cycle < 0 or duty_cycle > 1:
                 if fan_id not in self._last_diagnostic_log or current_time - self._last_diagnostic_log[fan_id] > 10:
-                    self.printw(f"Fan {fan_id+1} duty cycle abnormal: {reading.duty_cycle:.2f}")
+                    self.printw(f"Fan {fan_id+1} duty cycle abnormal: {duty_cycle:.2f}")
                     self._last_diagnostic_log[fan_id] = current_time
                 
         except Exception as e:
             self.printd(f"Tach signal diagnosis error: {e}")
     
-    def _process_tach_reading(self, reading: TachReading):
-        """Process single Tach reading"""
-        fan_id = reading.fan_id
-        
-        # Ensure data storage is initialized
-        if fan_id not in self.tach_data:
-            self.tach_data[fan_id] = {
-                'timestamps': deque(maxlen=MAX_DATA_POINTS),
-                'rpm_values': deque(maxlen=MAX_DATA_POINTS),
-                'filtered_rpm': deque(maxlen=MAX_DATA_POINTS),
-                'duty_cycles': deque(maxlen=MAX_DATA_POINTS),
-                'timeouts': deque(maxlen=MAX_DATA_POINTS),
-                'raw_signals': deque(maxlen=MAX_DATA_POINTS)  # Raw signal data
-            }
-        
-        # Apply filtering
-        filtered_rpm = self._apply_tach_filter(fan_id, reading.rpm)
-        
-        # Perform diagnostic checks
-        self._diagnose_tach_signal(fan_id, reading, filtered_rpm)
-        
-        # Store data
-        data = self.tach_data[fan_id]
-        data['timestamps'].append(reading.timestamp)
-        data['rpm_values'].append(reading.rpm)
-        data['filtered_rpm'].append(filtered_rpm)
-        data['duty_cycles'].append(reading.duty_cycle)
-        data['timeouts'].append(reading.timeout)
-        data['raw_signals'].append(reading.raw_signal)  # Store raw signal data
+    def _process_tach_readings(self, readings):
+        """Process one batch of Tach readings (at most one per fan)"""
+        if not readings:
+            return
+        
+        self._process_tach_batch(
+            [reading.fan_id for reading in readings],
+            [reading.timestamp for reading in readings],
+            [reading.rpm for reading in readings],
+            [reading.duty_cycle for reading in readings],
+            [reading.timeout for reading in readings],
+            [reading.raw_signal for reading in readings])
+    
+    def _process_tach_batch(self, fan_ids, timestamps, rpms, duty_cycles, timeouts, raw_signals):
+        """Process one sample per fan given as parallel sequences (scalars are broadcast)"""
+        # Apply filtering to all fans at once
+        filtered = np.asarray(self._apply_tach_filter(fan_ids, rpms), dtype=np.float64)
+        columns = [np.broadcast_to(np.asarray(column), filtered.shape).tolist()
+                   for column in (fan_ids, timestamps, rpms, duty_cycles, timeouts, raw_signals)]
+        
+        for fan_id, timestamp, rpm, duty_cycle, timeout, raw_signal, filtered_rpm in zip(
+                *columns, filtered.tolist()):
+            # Ensure data storage is initialized
+            if fan_id not in self.tach_data:
+                self.tach_data[fan_id] = TachBuffer()
+            
+            # Perform diagnostic checks
+            self._diagnose_tach_signal(fan_id, timeout, duty_cycle, filtered_rpm)
+            
+            # Store data
+            self.tach_data[fan_id].append(timestamp, rpm, filtered_rpm,
+                duty_cycle, timeout, raw_signal)
     
     def _generate_mock_tach_data(self, timestamp):
         """Generate simulated Tach data or get real data"""
@@ -978,17 +1158,18 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
             if hasattr(self.fc_communicator, 'get_rpm_data'):
                 rpm_data = self.fc_communicator.get_rpm_data()
                 if rpm_data:
+                    readings = []
                     for fan_id, rpm_value in enumerate(rpm_data):
                         if fan_id in self.tach_config.enabled_fans and fan_id < len(rpm_data):
                             # Create real Tach reading
-                            reading = TachReading(
+                            readings.append(TachReading(
                                 fan_id=fan_id,
                                 rpm=float(rpm_value),
                                 timestamp=timestamp,
                                 duty_cycle=0.0,  # Need to get from FCCommunicator
                                 timeout=False
-                            )
-                            self._process_tach_reading(reading)
+                            ))
+                    self._process_tach_readings(readings)
             else:
                 # If no get_rpm_data method, fallback to simulated data only if enabled
                 if self.tach_config.enable_simulation:
@@ -1002,41 +1183,28 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
                 self.printd(f"Failed to get real Tach data: {e}, simulation disabled")
     
     def _generate_simulated_tach_data(self, timestamp):
-        """Generate simulated Tach data (for testing)"""
-        import random
-        
-        # self.printd(f"Generating simulated Tach data for {len(self.tach_config.enabled_fans)} enabled fans")
-        
-        for fan_id in range(21):  # Simulate all 21 fans (maximum supported)
-            if fan_id in self.tach_config.enabled_fans:
-                # Generate simulated RPM values
-                base_rpm = 1000 + fan_id * 200
-                noise = random.uniform(-50, 50)
-                rpm = max(0, base_rpm + noise)
-                
-                # Generate simulated raw signal (pulse amplitude)
-                import math
-                signal_freq = rpm / 60.0 * 2  # Assume 2 pulses per revolution
-                raw_signal = 3.3 * (0.5 + 0.5 * math.sin(2 * math.pi * signal_freq * timestamp))
-                raw_signal += random.uniform(-0.1, 0.1)  # Add noise
-                
-                # Simulate timeout
-                timeout = random.random() < 0.05  # 5% timeout rate
-                if timeout:
-                    rpm = 0
-                    raw_signal = 0
-                
-                # Create simulated reading
-                reading = TachReading(
-                    fan_id=fan_id,
-                    rpm=rpm,
-                    timestamp=timestamp,
-                    duty_cycle=0.5 + fan_id * 0.1,
-                    timeout=timeout,
-                    raw_signal=raw_signal
-                )
-                
-                self._process_tach_reading(reading)
+        """Generate simulated Tach data for all enabled fans at once (for testing)"""
+        # Simulate all 21 fans (maximum supported)
+        fan_ids = np.intersect1d(np.arange(21), self.tach_config.enabled_fans)
+        count = len(fan_ids)
+        if not count:
+            return
+        
+        # Generate simulated RPM values
+        rpms = np.maximum(0, 1000 + fan_ids * 200 + self._rng.uniform(-50, 50, count))
+        
+        # Generate simulated raw signal (pulse amplitude)
+        signal_freqs = rpms / 60.0 * 2  # Assume 2 pulses per revolution
+        raw_signals = 3.3 * (0.5 + 0.5 * np.sin(2 * np.pi * signal_freqs * timestamp))
+        raw_signals += self._rng.uniform(-0.1, 0.1, count)  # Add noise
+        
+        # Simulate timeout
+        timeouts = self._rng.random(count) < 0.05  # 5% timeout rate
+        rpms[timeouts] = 0
+        raw_signals[timeouts] = 0
+        
+        self._process_tach_batch(fan_ids, timestamp, rpms, 0.5 + fan_ids * 0.1,
+                                 timeouts, raw_signals)
     
     def _generate_mock_signal_data(self, timestamp):
         """Generate simulated signal data (backup method)"""
@@ -1045,10 +1213,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         # Generate different frequency sine waves for each channel
         for channel in range(3):
             if f'channel_{channel}' not in self.signal_data:
-                self.signal_data[f'channel_{channel}'] = {
-                    'timestamps': deque(maxlen=MAX_DATA_POINTS),
-                    'values': deque(maxlen=MAX_DATA_POINTS)
-                }
+                self.signal_data[f'channel_{channel}'] = SignalBuffer()
             
             # Generate signal values
             freq = 10.0 + channel * 5.0  # Different frequencies
@@ -1056,29 +1221,20 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
             noise = (time.time() % 1 - 0.5) * 0.1  # Add noise
             value = amplitude * math.sin(2 * math.pi * freq * timestamp) + noise
             
-            self.signal_data[f'channel_{channel}']['timestamps'].append(timestamp)
-            self.signal_data[f'channel_{channel}']['values'].append(value)
+            self.signal_data[f'channel_{channel}'].append(timestamp, value)
     
     def _generate_mock_system_data(self, timestamp):
         """Generate simulated system performance data"""
-        import random
-        
-        # CPU usage (simulate fluctuation)
-        cpu_usage = 20 + 30 * abs(math.sin(timestamp * 0.1)) + random.uniform(-5, 5)
-        cpu_usage = max(0, min(100, cpu_usage))
-        
-        # Memory usage
-        mem_usage = 40 + 20 * abs(math.cos(timestamp * 0.05)) + random.uniform(-3, 3)
-        mem_usage = max(0, min(100, mem_usage))
+        # CPU and memory usage (simulate fluctuation), drawn in one call
+        cpu_noise, mem_noise = self._rng.uniform((-5, -3), (5, 3))
+        cpu_usage = min(max(20 + 30 * abs(math.sin(timestamp * 0.1)) + cpu_noise, 0), 100)
+        mem_usage = min(max(40 + 20 * abs(math.cos(timestamp * 0.05)) + mem_noise, 0), 100)
         
         # Network packet count
-        packet_count = len(self.system_stats['timestamps']) * 10 + random.randint(0, 5)
+        packet_count = len(self.system_stats) * 10 + int(self._rng.integers(0, 6))
         
         # Update system statistics
-        self.system_stats['cpu_usage'].append(cpu_usage)
-        self.system_stats['memory_usage'].append(mem_usage)
-        self.system_stats['network_packets'].append(packet_count)
-        self.system_stats['timestamps'].append(timestamp)
+        self.system_stats.append(timestamp, cpu_usage, mem_usage, packet_count)
     
     def _schedule_gui_update(self):
         """Schedule GUI update - PERFORMANCE: Limited for better performance"""
@@ -1187,28 +1343,26 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
     
     def _update_signal_plot(self):
         """Update signal charts"""
+        x_min = y_min = math.inf
+        x_max = y_max = -math.inf
         for i, line in enumerate(self.signal_lines):
             channel_key = f'channel_{i}'
             if channel_key in self.signal_data:
                 data = self.signal_data[channel_key]
-                if data['timestamps'] and data['values']:
-                    line.set_data(list(data['timestamps']), list(data['values']))
-        
-        # Auto-adjust coordinate axes
-        if self.signal_data:
-            all_timestamps = []
-            all_values = []
-            for data in self.signal_data.values():
-                all_timestamps.extend(data['timestamps'])
-                all_values.extend(data['values'])
-            
-            if all_timestamps and all_values:
-                self.signal_ax.set_xlim(min(all_timestamps), max(all_timestamps))
-                self.signal_ax.set_ylim(min(all_values) - 0.5, max(all_values) + 0.5)
-        
+                if len(data):
+                    timestamps = data['timestamps'].copy()
+                    values = data['values'].copy()
+                    line.set_data(timestamps, values)
+                    x_min, x_max = min(x_min, timestamps[0]), max(x_max, timestamps[-1])
+                    y_min, y_max = min(y_min, values.min()), max(y_max, values.max())
+        
+        # Auto-adjust coordinate axes; only a limit change needs a full redraw
         try:
             if hasattr(self, 'signal_canvas') and self.signal_canvas:
-                self.signal_canvas.draw_idle()
+                if x_min <= x_max and fit_limits(self.signal_ax, x_min, x_max, y_min, y_max, 0.5):
+                    self.signal_blit.invalidate()
+                else:
+                    self.signal_blit.update()
         except (tk.TclError, AttributeError, RuntimeError):
             # Canvas destroyed or not available
             pass
@@ -1218,7 +1372,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         self.signal_text.delete(1.0, tk.END)
         
         for channel_key, data in self.signal_data.items():
-            if data['timestamps'] and data['values']:
+            if len(data):
                 latest_time = data['timestamps'][-1]
                 latest_value = data['values'][-1]
                 self.signal_text.insert(tk.END, 
@@ -1226,26 +1380,20 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
     
     def _update_performance_plot(self):
         """Update performance charts"""
-        timestamps = list(self.system_stats['timestamps'])
-        cpu_data = list(self.system_stats['cpu_usage'])
-        mem_data = list(self.system_stats['memory_usage'])
+        timestamps = self.system_stats['timestamps'].copy()
+        changed = False
         
-        if timestamps:
-            self.cpu_line.set_data(timestamps, cpu_data)
-            self.mem_line.set_data(timestamps, mem_data)
-            
-            # Ensure minimum range for xlims to avoid singular transformation
-            min_time = min(timestamps)
-            max_time = max(timestamps)
-            if max_time - min_time < 0.1:  # Minimum 0.1 second range
-                center = (min_time + max_time) / 2
-                min_time = center - 0.05
-                max_time = center + 0.05
-            self.perf_ax.set_xlim(min_time, max_time)
+        if len(timestamps):
+            self.cpu_line.set_data(timestamps, self.system_stats['cpu_usage'].copy())
+            self.mem_line.set_data(timestamps, self.system_stats['memory_usage'].copy())
+            changed = fit_limits(self.perf_ax, timestamps[0], timestamps[-1])
             
         try:
             if hasattr(self, 'perf_canvas') and self.perf_canvas:
-                self.perf_canvas.draw_idle()
+                if changed:
+                    self.perf_blit.invalidate()
+                else:
+                    self.perf_blit.update()
         except (tk.TclError, AttributeError, RuntimeError):
             # Canvas destroyed or not available
             pass
@@ -1254,7 +1402,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         """Update performance text display"""
         self.perf_text.delete(1.0, tk.END)
         
-        if self.system_stats['timestamps']:
+        if len(self.system_stats):
             latest_time = self.system_stats['timestamps'][-1]
             latest_cpu = self.system_stats['cpu_usage'][-1]
             latest_mem = self.system_stats['memory_usage'][-1]
@@ -1266,11 +1414,11 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
     
     def _update_system_info(self):
         """Update system information display"""
-        if self.system_stats['timestamps']:
+        if len(self.system_stats):
             runtime = self.system_stats['timestamps'][-1]
-            cpu_usage = self.system_stats['cpu_usage'][-1] if self.system_stats['cpu_usage'] else 0
-            mem_usage = self.system_stats['memory_usage'][-1] if self.system_stats['memory_usage'] else 0
-            packet_count = self.system_stats['network_packets'][-1] if self.system_stats['network_packets'] else 0
+            cpu_usage = self.system_stats['cpu_usage'][-1]
+            mem_usage = self.system_stats['memory_usage'][-1]
+            packet_count = int(self.system_stats['network_packets'][-1])
             
             # Format runtime
             hours = int(runtime // 3600)
@@ -1286,7 +1434,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
             self.system_info_labels['Connected Devices'].configure(text="3")  # Simulated value
             
             # Calculate packets/second
-            if len(self.system_stats['timestamps']) > 1:
+            if len(self.system_stats) > 1:
                 time_diff = self.system_stats['timestamps'][-1] - self.system_stats['timestamps'][-2]
                 if time_diff > 0:
                     packets_per_sec = 10 / time_diff  # Simulated value
@@ -1295,7 +1443,7 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
     def _update_status_bar(self):
         """Update status bar"""
         # Data point count
-        total_points = sum(len(data['timestamps']) for data in self.signal_data.values())
+        total_points = sum(len(data) for data in self.signal_data.values())
         self.data_count_label.configure(text=str(total_points))
         
         # Last update time
@@ -1311,107 +1459,86 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         # Signal statistics
         stats_info += "Signal Statistics:\n"
         for channel_key, data in self.signal_data.items():
-            if data['values']:
-                values = list(data['values'])
-                avg_val = sum(values) / len(values)
-                min_val = min(values)
-                max_val = max(values)
+            if len(data):
+                values = data['values']
+                avg_val = values.mean()
+                min_val = values.min()
+                max_val = values.max()
                 stats_info += f"  {channel_key}: Average={avg_val:.3f}, Min={min_val:.3f}, Max={max_val:.3f}\n"
         
         # System statistics
         stats_info += "\nSystem Statistics:\n"
-        if self.system_stats['cpu_usage']:
-            cpu_values = list(self.system_stats['cpu_usage'])
-            avg_cpu = sum(cpu_values) / len(cpu_values)
+        if len(self.system_stats):
+            avg_cpu = self.system_stats['cpu_usage'].mean()
             stats_info += f"  Average CPU Usage: {avg_cpu:.1f}%\n"
-        
-        if self.system_stats['memory_usage']:
-            mem_values = list(self.system_stats['memory_usage'])
-            avg_mem = sum(mem_values) / len(mem_values)
+            
+            avg_mem = self.system_stats['memory_usage'].mean()
             stats_info += f"  Average Memory Usage: {avg_mem:.1f}%\n"
         
-        stats_info += f"\nTotal Data Points: {sum(len(data['timestamps']) for data in self.signal_data.values())}\n"
-        stats_info += f"Monitoring Duration: {self.system_stats['timestamps'][-1]:.1f}s\n" if self.system_stats['timestamps'] else "Monitoring Duration: 0s\n"
+        stats_info += f"\nTotal Data Points: {sum(len(data) for data in self.signal_data.values())}\n"
+        stats_info += f"Monitoring Duration: {self.system_stats['timestamps'][-1]:.1f}s\n" if len(self.system_stats) else "Monitoring Duration: 0s\n"
         
         self.stats_text.insert(tk.END, stats_info)
     
     def _update_tach_plot(self):
         """Update Tach plot display"""
         try:
-            # Update raw signal plot (if enabled)
-            if self.tach_config.show_raw_signal:
-                self.tach_ax_raw.clear()
-                self.tach_ax_raw.set_facecolor(SURFACE_2)
-                self.tach_ax_raw.set_title('Raw Tach Signal Monitoring', color=TEXT_PRIMARY, fontsize=12)
-                self.tach_ax_raw.set_xlabel('Time (s)', color=TEXT_PRIMARY)
-                self.tach_ax_raw.set_ylabel('Signal Amplitude (V)', color=TEXT_PRIMARY)
-                self.tach_ax_raw.tick_params(colors=TEXT_PRIMARY)
-                self.tach_ax_raw.grid(True, alpha=0.3)
-                
-                # Plot raw signal curves for first 6 fans
-                for fan_id in range(min(6, len(self.tach_data))):
-                    if fan_id in self.tach_data:
-                        data = self.tach_data[fan_id]
-                        if data['timestamps'] and data['raw_signals']:
-                            timestamps = list(data['timestamps'])
-                            raw_signals = list(data['raw_signals'])
-                            color = TACH_COLORS[fan_id % len(TACH_COLORS)]
-                            self.tach_ax_raw.plot(timestamps, raw_signals, color=color, 
-                                               label=f'Fan{fan_id+1}', linewidth=1, alpha=0.7)
-                
-                self.tach_ax_raw.legend()
-            
-            # Update RPM time series plot
-            self.tach_ax1.clear()
-            self.tach_ax1.set_facecolor(SURFACE_2)
-            self.tach_ax1.set_title('Fan Speed Real-time Monitoring', color=TEXT_PRIMARY, fontsize=12)
-            self.tach_ax1.set_xlabel('Time (s)', color=TEXT_PRIMARY)
-            self.tach_ax1.set_ylabel('Speed (RPM)', color=TEXT_PRIMARY)
-            self.tach_ax1.tick_params(colors=TEXT_PRIMARY)
-            self.tach_ax1.grid(True, alpha=0.3)
-            
-            # Plot RPM curves for first 6 fans
-            for fan_id in range(min(6, len(self.tach_data))):
-                if fan_id in self.tach_data:
-                    data = self.tach_data[fan_id]
-                    if data['timestamps'] and data['filtered_rpm']:
-                        timestamps = list(data['timestamps'])
-                        rpm_values = list(data['filtered_rpm'])
-                        color = TACH_COLORS[fan_id % len(TACH_COLORS)]
-                        self.tach_ax1.plot(timestamps, rpm_values, color=color, 
-                                         label=f'Fan{fan_id+1}', linewidth=2)
+            fans = [fan_id for fan_id in range(min(6, len(self.tach_data)))
+                    if fan_id in self.tach_data and len(self.tach_data[fan_id])]
+            redraw = any(fan_id not in self.tach_lines for fan_id in fans)
+            if redraw:
+                self._add_tach_lines(fans)
+            for fan_id, lines in self.tach_lines.items():
+                if fan_id not in fans:
+                    for line in lines:
+                        line.set_data([], [])
             
-            self.tach_ax1.legend()
-            
-            # Update RPM distribution bar chart
-            self.tach_ax2.clear()
-            self.tach_ax2.set_facecolor(SURFACE_2)
-            self.tach_ax2.set_title('Current Speed Distribution', color=TEXT_PRIMARY, fontsize=12)
-            self.tach_ax2.set_xlabel('Fan Number', color=TEXT_PRIMARY)
-            self.tach_ax2.set_ylabel('Speed (RPM)', color=TEXT_PRIMARY)
-            self.tach_ax2.tick_params(colors=TEXT_PRIMARY)
-            self.tach_ax2.grid(True, alpha=0.3, axis='y')
-            
-            # Plot current RPM bar chart
-            fan_ids = []
-            current_rpms = []
-            colors = []
+            # Update raw signal and RPM time series curves for first 6 fans
+            x_min = raw_min = rpm_min = math.inf
+            x_max = raw_max = rpm_max = -math.inf
+            for fan_id in fans:
+                data = self.tach_data[fan_id]
+                raw_line, rpm_line = self.tach_lines[fan_id]
+                timestamps = data['timestamps'].copy()
+                rpm_values = data['filtered_rpm'].copy()
+                rpm_line.set_data(timestamps, rpm_values)
+                x_min, x_max = min(x_min, timestamps[0]), max(x_max, timestamps[-1])
+                rpm_min, rpm_max = min(rpm_min, rpm_values.min()), max(rpm_max, rpm_values.max())
+                
+                # Update raw signal plot (if enabled)
+                if self.tach_config.show_raw_signal:
+                    raw_signals = data['raw_signals'].copy()
+                    raw_line.set_data(timestamps, raw_signals)
+                    raw_min, raw_max = min(raw_min, raw_signals.min()), max(raw_max, raw_signals.max())
             
-            for fan_id in range(min(6, len(self.tach_data))):
-                if fan_id in self.tach_data:
-                    data = self.tach_data[fan_id]
-                    if data['filtered_rpm']:
-                        fan_ids.append(fan_id + 1)
-                        current_rpms.append(data['filtered_rpm'][-1])
-                        colors.append(TACH_COLORS[fan_id % len(TACH_COLORS)])
+            if fans:
+                redraw |= fit_limits(self.tach_ax1, x_min, x_max, rpm_min, rpm_max,
+                                     max(0.05 * (rpm_max - rpm_min), 1.0))
+                if self.tach_config.show_raw_signal:
+                    redraw |= fit_limits(self.tach_ax_raw, x_min, x_max, raw_min, raw_max,
+                                         max(0.05 * (raw_max - raw_min), 0.1))
             
-            if fan_ids:
-                self.tach_ax2.bar(fan_ids, current_rpms, color=colors, alpha=0.7)
+            # The bar chart is not blitted: redraw it only when a fan joins or a
+            # current RPM moves past TACH_BAR_REDRAW_RPM since it was last drawn
+            current_rpms = np.array([self.tach_data[fan_id]['filtered_rpm'][-1] for fan_id in fans])
+            if tuple(fans) != self.tach_bar_fans:
+                self._rebuild_tach_bars(fans, current_rpms)
+                redraw = True
+            elif fans and np.abs(current_rpms - self.tach_bar_rpms).max() > TACH_BAR_REDRAW_RPM:
+                for bar, rpm in zip(self.tach_bars, current_rpms):
+                    bar.set_height(rpm)
+                self.tach_bar_rpms = current_rpms
+                self.tach_ax2.relim()
+                self.tach_ax2.autoscale_view()
+                redraw = True
             
             # Layout is handled by subplots_adjust in _build_tach_plot
             try:
                 if hasattr(self, 'tach_canvas') and self.tach_canvas:
-                    self.tach_canvas.draw_idle()
+                    if redraw:
+                        self.tach_blit.invalidate()
+                    else:
+                        self.tach_blit.update()
             except (tk.TclError, AttributeError, RuntimeError):
                 # Canvas destroyed or not available
                 pass
@@ -1419,6 +1546,38 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         except Exception as e:
             self.printd(f"Tach plot update error: {e}")
     
+    def _add_tach_lines(self, fans):
+        """Create the persistent raw signal and RPM curves of newly seen fans"""
+        for fan_id in fans:
+            if fan_id in self.tach_lines:
+                continue
+            color = TACH_COLORS[fan_id % len(TACH_COLORS)]
+            raw_line, = self.tach_ax_raw.plot([], [], color=color, label=f'Fan{fan_id+1}',
+                                              linewidth=1, alpha=0.7, animated=True)
+            rpm_line, = self.tach_ax1.plot([], [], color=color, label=f'Fan{fan_id+1}',
+                                           linewidth=2, animated=True)
+            self.tach_lines[fan_id] = (raw_line, rpm_line)
+            self.tach_raw_artists.append(raw_line)
+            self.tach_rpm_artists.append(rpm_line)
+        
+        if self.tach_config.show_raw_signal:
+            self.tach_ax_raw.legend()
+        self.tach_ax1.legend()
+    
+    def _rebuild_tach_bars(self, fans, current_rpms):
+        """Replace the current RPM bar chart for a new set of fans"""
+        if self.tach_bars is not None:
+            self.tach_bars.remove()
+            self.tach_bars = None
+        if fans:
+            colors = [TACH_COLORS[fan_id % len(TACH_COLORS)] for fan_id in fans]
+            self.tach_bars = self.tach_ax2.bar([fan_id + 1 for fan_id in fans], current_rpms,
+                                               color=colors, alpha=0.7)
+            self.tach_ax2.relim()
+            self.tach_ax2.autoscale_view()
+        self.tach_bar_fans = tuple(fans)
+        self.tach_bar_rpms = current_rpms
+    
     def _update_tach_text(self):
         """Update Tach text display"""
         try:
@@ -1430,12 +1589,12 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
             
             for fan_id in sorted(self.tach_data.keys()):
                 data = self.tach_data[fan_id]
-                if data['timestamps']:
+                if len(data):
                     latest_time = data['timestamps'][-1]
-                    raw_rpm = data['rpm_values'][-1] if data['rpm_values'] else 0
-                    filtered_rpm = data['filtered_rpm'][-1] if data['filtered_rpm'] else 0
-                    duty_cycle = data['duty_cycles'][-1] if data['duty_cycles'] else 0
-                    timeout = data['timeouts'][-1] if data['timeouts'] else False
+                    raw_rpm = data['rpm_values'][-1]
+                    filtered_rpm = data['filtered_rpm'][-1]
+                    duty_cycle = data['duty_cycles'][-1]
+                    timeout = bool(data['timeouts'][-1])
                     
                     status = "Timeout" if timeout else "Normal"
                     
@@ -1453,9 +1612,9 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
                     data = self.tach_data[fan_id]
                     labels = self.tach_status_labels[fan_id]
                     
-                    if data['filtered_rpm'] and data['timeouts']:
+                    if len(data):
                         current_rpm = data['filtered_rpm'][-1]
-                        is_timeout = data['timeouts'][-1]
+                        is_timeout = bool(data['timeouts'][-1])
                         
                         # Update RPM display
                         labels['rpm'].configure(text=f"{current_rpm:.0f} RPM")
@@ -1547,9 +1706,9 @@ class MonitoringWidget(ttk.Frame, pt.PrintClient):
         """Get monitoring status"""
         return {
             'active': self.monitoring_active,
-            'data_points': sum(len(data['timestamps']) for data in self.signal_data.values()),
+            'data_points': sum(len(data) for data in self.signal_data.values()),
             'channels': len(self.signal_data),
-            'runtime': self.system_stats['timestamps'][-1] if self.system_stats['timestamps'] else 0,
+            'runtime': float(self.system_stats['timestamps'][-1]) if len(self.system_stats) else 0,
             'tach_monitoring': self.tach_monitoring_active,
             'tach_fans': len(self.tach_data)
         }
\ No newline at end of file
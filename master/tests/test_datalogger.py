@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+from multiprocessing import Queue
+
+# Ensure project root on sys.path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import fc.archive as ac
+from fc.frontend.gui.widgets.control import DataLogger
+
+
+def run_logger(tmp_path, vectors, slaves = None, maxFans = 2):
+    """
+    Log the given (F, t) pairs with a DataLogger and return the lines of the
+    resulting log file.
+    """
+    filename = str(tmp_path / "log.csv")
+    archive = {ac.version: "TEST", ac.name: "PROFILE", ac.maxFans: maxFans,
+        ac.fanArray: {ac.FA_rows: 1, ac.FA_columns: 2, ac.FA_layers: 1}}
+    logger = DataLogger(archive, Queue())
+    if slaves is None:
+        slaves = {1: ("A", "00:00"), 2: ("B", "00:01")}
+    logger.slaves.update(slaves)
+    logger.start(filename)
+    for F, t in vectors:
+        logger.feedbackIn(F, t)
+    logger.stop()
+    with open(filename) as f:
+        return f.read().splitlines()
+
+
+def test_datalogger_header_columns(tmp_path):
+    lines = run_logger(tmp_path, [])
+    assert lines[-1] == "Time (s),s1rpm1,s1rpm2,s2rpm1,s2rpm2," \
+        "s1dc1,s1dc2,s2dc1,s2dc2,"
+
+
+def test_datalogger_rows(tmp_path):
+    lines = run_logger(tmp_path, [
+        ([100, -666, -666, -1666, 0.5, -666, 1, 0], 1e12),
+        ([101, 201, 301, 401, 0.5, 0.25, 1, 0], 2e12),
+        ([7, 8], 3e12),
+    ])
+    rows = [line.split(",") for line in lines[-3:]]
+    for row in rows:
+        assert row[-1] == ""
+        float(row[0])
+    assert rows[0][1:-1] == ["100", "NaN", "NaN", "-1666", "0.5", "NaN",
+        "1", "0"]
+    assert rows[1][1:-1] == ["101", "201", "301", "401", "0.5", "0.25", "1",
+        "0"]
+    assert rows[2][1:-1] == ["7", "8"]
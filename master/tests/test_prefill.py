@@ -349,4 +349,56 @@ def test_livetable_initially_paused_feedback_and_map():
     lt.selected_g[0] = True
     lt.selected_count = 1
     lt.map(LiveTable._const(0.55), 0, 0)
-    assert approx_list(capture.last) == [0.55, 0.3, 0.4, 0.5]
\ No newline at end of file
+    assert approx_list(capture.last) == [0.55, 0.3, 0.4, 0.5]
+
+def test_gridwidget_rectangle_release_non_square():
+    root = tk_root()
+    q = Queue()
+    ar = FCArchive(q, "TEST-NS", FCArchive.DEFAULT)
+    P = ar.profile()
+    P[ac.maxFans] = 6
+    P[ac.fanArray] = {ac.FA_rows: 2, ac.FA_columns: 3, ac.FA_layers: 1}
+    base = dict(P[ac.defaultSlave])
+    base[ac.SV_index] = 0
+    base[ac.MD_assigned] = True
+    base[ac.MD_row] = 0
+    base[ac.MD_column] = 0
+    base[ac.MD_rows] = 2
+    base[ac.MD_columns] = 3
+    base[ac.MD_mapping] = "0,1,2,3,4,5"
+    P[ac.savedSlaves] = (base,)
+    ar.profile(P)
+
+    grid = GridWidget(root, ar, Mapper(ar), CaptureSend(), q)
+    grid.draw(cellLength=20)
+    grid.selectMode.set(grid.SM_SELECT)
+
+    # Drag from (r=0, c=1) to (r=1, c=2) on a 2x3 grid
+    grid.drag_start, grid.drag_end = 1, 5
+    selected = []
+    GridWidget._generalRelease(grid, 5, selected.append)
+    assert selected == [1, 2, 4, 5]
+
+
+def test_livetable_deactivate_discards_pending_flush():
+    root = tk_root()
+    ar = build_minimal_archive()
+    mapper = Mapper(ar)
+    q = Queue()
+
+    lt = LiveTable(root, ar, mapper, CaptureSend(), None, q)
+    lt.playPauseFlag = True
+
+    # First vector creates and fills the slave rows once Tk is idle
+    F = [1200, 1300, 1400, 1500] + [0.2, 0.3, 0.4, 0.5]
+    lt.feedbackIn(F)
+    root.update_idletasks()
+    assert len(lt.slaves) == 1
+
+    # A vector still waiting for the idle flush must not repaint the rows
+    # as active after the network is shut down
+    lt.feedbackIn(F)
+    lt.deactivate()
+    root.update_idletasks()
+    for iid in lt.slaves:
+        assert "D" in lt.table.item(iid, "tags")